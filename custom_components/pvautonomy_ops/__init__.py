@@ -8,15 +8,20 @@ Contract: ops-contract-v1.md (v1.0.0)
 Directive: D-ADDON-002, D-ADDON-BASELINE-SEC-001, P3-6-001
 """
 import logging
-from datetime import timedelta
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONTRACT_VERSION, DOMAIN, UPDATE_INTERVAL, VERSION
+from .artifacts import FirmwareCache
+from .const import CONTRACT_VERSION, DOMAIN, VERSION
 from .config_flow import (
     CONF_ARTIFACT_CHANNEL,
     CONF_ARTIFACT_HW_FAMILY,
@@ -35,7 +40,9 @@ from .config_flow import (
     DEFAULT_POLL_INTERVAL,
     DEFAULT_STRICT_GATES,
 )
+from .coordinator import PVAutonomyOpsCoordinator
 from .discovery import ContractInputReader
+from .flash_guards import resolve_guard_config
 from .operations import OperationLock, OperationRunner, OperationTracker
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,27 +50,32 @@ _LOGGER = logging.getLogger(__name__)
 # Platforms to forward via ConfigEntry
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 
+# Runtime config defaults (merged under ConfigEntry options)
+_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        CONF_POLL_INTERVAL: DEFAULT_POLL_INTERVAL,
+        CONF_ARTIFACT_CHANNEL: DEFAULT_ARTIFACT_CHANNEL,
+        CONF_ARTIFACT_HW_FAMILY: DEFAULT_ARTIFACT_HW_FAMILY,
+        CONF_ARTIFACT_OWNER: DEFAULT_ARTIFACT_OWNER,
+        CONF_ARTIFACT_REPO: DEFAULT_ARTIFACT_REPO,
+        CONF_FLASH_MIN_SIZE_KB: DEFAULT_FLASH_MIN_SIZE_KB,
+        CONF_GATES_FRESHNESS_MIN: DEFAULT_GATES_FRESHNESS_MIN,
+        CONF_STRICT_GATES: DEFAULT_STRICT_GATES,
+    }
+)
+
 
-def get_runtime_config(entry: ConfigEntry) -> dict:
-    """Build runtime config dict from ConfigEntry options with defaults.
+def get_runtime_config(entry: ConfigEntry) -> Mapping[str, Any]:
+    """Build runtime config snapshot from ConfigEntry options with defaults.
 
     Args:
         entry: The config entry to read options from.
 
     Returns:
-        Dict with all runtime config values (guaranteed complete with defaults).
+        Read-only mapping with all runtime config values (guaranteed
+        complete with defaults). Rebuilt only on options update.
     """
-    opts = entry.options
-    return {
-        CONF_POLL_INTERVAL: opts.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
-        CONF_ARTIFACT_CHANNEL: opts.get(CONF_ARTIFACT_CHANNEL, DEFAULT_ARTIFACT_CHANNEL),
-        CONF_ARTIFACT_HW_FAMILY: opts.get(CONF_ARTIFACT_HW_FAMILY, DEFAULT_ARTIFACT_HW_FAMILY),
-        CONF_ARTIFACT_OWNER: opts.get(CONF_ARTIFACT_OWNER, DEFAULT_ARTIFACT_OWNER),
-        CONF_ARTIFACT_REPO: opts.get(CONF_ARTIFACT_REPO, DEFAULT_ARTIFACT_REPO),
-        CONF_FLASH_MIN_SIZE_KB: opts.get(CONF_FLASH_MIN_SIZE_KB, DEFAULT_FLASH_MIN_SIZE_KB),
-        CONF_GATES_FRESHNESS_MIN: opts.get(CONF_GATES_FRESHNESS_MIN, DEFAULT_GATES_FRESHNESS_MIN),
-        CONF_STRICT_GATES: opts.get(CONF_STRICT_GATES, DEFAULT_STRICT_GATES),
-    }
+    return MappingProxyType({**_DEFAULTS, **entry.options})
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -106,6 +118,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     operation_lock = OperationLock()
     operation_tracker = OperationTracker(hass)
     operation_runner = OperationRunner(hass, operation_tracker, operation_lock)
+    coordinator = PVAutonomyOpsCoordinator(
+        hass, input_reader, operation_tracker, poll_interval
+    )
 
     # Store in hass.data for platforms to access
     hass.data.setdefault(DOMAIN, {})
@@ -114,51 +129,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "operation_lock": operation_lock,
         "operation_tracker": operation_tracker,
         "operation_runner": operation_runner,
+        "coordinator": coordinator,
         "config": runtime_config,
+        # Flash guard settings (FlashGuardConfig); only a poll interval
+        # change skips the reload that rebuilds them
+        "guard_config": resolve_guard_config(runtime_config),
         "entry": entry,
+        # Latest gates verdict (GatesSnapshot), set by the Run Gates button
+        "gates": None,
+        # Shared HTTP session (keepalive pool reused across artifact GETs)
+        "http": async_get_clientsession(hass),
+        # Verified firmware reused across flash operations
+        "fw_cache": FirmwareCache(
+            Path(hass.config.path(".storage", f"{DOMAIN}_fw_cache"))
+        ),
+        # OTA passwords read from secrets.yaml, keyed by device
+        "ota_passwords": {},
     }
 
+    # Keep the input reader's entity indexes in sync with HA
+    entry.async_on_unload(input_reader.async_start_listeners())
+
+    # Switch coordinator to the active poll interval when an operation starts
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            f"{DOMAIN}_operation_started", coordinator.async_operation_started
+        )
+    )
+
     # Listen for options updates (live reload without restart)
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
-    # Defer platform setup until HA is fully started (templates ready)
-    async def start_integration(_event):
+    # Defer platform setup until HA is fully started (templates ready).
+    # async_at_started runs immediately if HA is already running (e.g. on
+    # options reload) and registers a single listener otherwise.
+    async def start_integration(_hass: HomeAssistant) -> None:
         """Initialize platforms and periodic updates after HA fully started."""
-        _LOGGER.info(
-            "HA fully started, forwarding platforms (version %s, contract %s)",
-            VERSION,
-            CONTRACT_VERSION,
-        )
+        _LOGGER.debug("HA fully started, forwarding platforms")
+
+        # Initial snapshot so entities render real values when added;
+        # the coordinator then refreshes every poll_interval seconds
+        await coordinator.async_refresh()
 
         # Forward platform setup via ConfigEntry (modern pattern)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        _LOGGER.info("Platform forwarding initiated")
-
-        # Schedule periodic update
-        async def periodic_update(_now=None):
-            """Periodic update handler."""
-            _LOGGER.debug("Periodic update triggered")
-            hass.bus.async_fire(f"{DOMAIN}_update")
-
-        _LOGGER.info(
-            "Starting periodic updates (interval=%s seconds)", poll_interval
+        _LOGGER.debug(
+            "Platform forwarding initiated (poll interval=%s seconds)", poll_interval
         )
-        cancel_timer = async_track_time_interval(
-            hass, periodic_update, timedelta(seconds=poll_interval)
-        )
-        # Store cancel handle for unload
-        hass.data[DOMAIN]["cancel_timer"] = cancel_timer
-
-        # Run initial update
-        await periodic_update()
 
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_integration)
+    entry.async_on_unload(async_at_started(hass, start_integration))
 
-    _LOGGER.info(
-        "PVAutonomy Ops entry setup complete. Waiting for HOMEASSISTANT_STARTED. HA State: %s",
-        hass.state,
-    )
+    _LOGGER.debug("PVAutonomy Ops entry setup complete (platforms deferred to HA start)")
     return True
 
 
@@ -166,12 +188,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a PVAutonomy Ops config entry."""
     _LOGGER.info("Unloading PVAutonomy Ops entry")
 
-    # Cancel periodic timer
-    cancel_timer = hass.data[DOMAIN].get("cancel_timer")
-    if cancel_timer:
-        cancel_timer()
-
-    # Unload platforms
+    # Unload platforms (coordinator stops polling once its entities are removed)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
@@ -184,5 +201,28 @@ async def _async_options_updated(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
     """Handle options update (live reload)."""
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is not None:
+        new_config = get_runtime_config(entry)
+        old_config = domain_data["config"]
+
+        # Skip the platform teardown/setup cycle when a save changed nothing
+        if new_config == old_config:
+            _LOGGER.debug("Options unchanged — skipping reload")
+            return
+
+        # Poll interval is hot-applied to the coordinator (no reload needed)
+        changed = {key for key in new_config if new_config[key] != old_config.get(key)}
+        if changed == {CONF_POLL_INTERVAL}:
+            _LOGGER.info(
+                "Poll interval changed to %s seconds — applying without reload",
+                new_config[CONF_POLL_INTERVAL],
+            )
+            domain_data["config"] = new_config
+            await domain_data["coordinator"].async_set_poll_interval(
+                new_config[CONF_POLL_INTERVAL]
+            )
+            return
+
     _LOGGER.info("Options updated — reloading PVAutonomy Ops entry")
     await hass.config_entries.async_reload(entry.entry_id)
@@ -3,18 +3,50 @@
 Downloads and verifies prebuilt firmware artifacts from GitHub Releases.
 """
 import asyncio
+import concurrent.futures
 import hashlib
 import logging
 import json
+import shutil
+from collections import OrderedDict
 from typing import Any
 from pathlib import Path
 
 import aiohttp
 
+from homeassistant.util.json import json_loads
+
 from .const import ARTIFACTS_BASE_URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Firmware download chunk size (bytes) for streaming to disk
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Fields every release manifest must declare
+_REQUIRED_MANIFEST_FIELDS: frozenset[str] = frozenset(
+    {"version", "channel", "hw_family", "sha256"}
+)
+
+# Dedicated single-writer pool for firmware file I/O + hashing, so a
+# multi-second firmware write never queues behind (or blocks) other
+# integrations on HA's shared executor
+_ARTIFACT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="pvops-artifact"
+)
+
+# HTTP timeouts: fail fast on connect, budget the body read separately so a
+# slow TLS handshake cannot eat into the firmware transfer time
+MANIFEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, connect=5, sock_connect=5, sock_read=30
+)
+FIRMWARE_TIMEOUT = aiohttp.ClientTimeout(
+    total=300, connect=5, sock_connect=5, sock_read=60
+)
+
+# Read size for re-hashing firmware from disk (bytes)
+HASH_CHUNK_SIZE = 1 << 20
+
 
 class ArtifactError(Exception):
     """Artifact download or verification failed."""
@@ -22,45 +54,56 @@ class ArtifactError(Exception):
 
 
 class FirmwareArtifact:
-    """Firmware artifact with manifest and binary."""
+    """Firmware artifact with manifest and binary.
+    
+    Manifest fields are materialised once at construction:
+        version: Firmware version
+        channel: Release channel (stable|beta|dev)
+        hw_family: Hardware family (edge101, etc.)
+        sha256: Expected SHA256 checksum
+        esphome_min: Minimum ESPHome version required
+    """
+    
+    __slots__ = (
+        "manifest",
+        "firmware_path",
+        "version",
+        "channel",
+        "hw_family",
+        "sha256",
+        "esphome_min",
+        "computed_sha256",
+        "verified",
+    )
     
-    def __init__(self, manifest: dict[str, Any], firmware_path: Path):
+    def __init__(
+        self,
+        manifest: dict[str, Any],
+        firmware_path: Path,
+        computed_sha256: str | None = None,
+    ):
         """Initialize firmware artifact.
         
         Args:
             manifest: Parsed manifest.json
             firmware_path: Path to downloaded firmware.bin
+            computed_sha256: SHA256 computed while streaming the download
+                (None = not computed, verify_artifact re-reads the file)
         """
         self.manifest = manifest
         self.firmware_path = firmware_path
-        
-    @property
-    def version(self) -> str:
-        """Firmware version from manifest."""
-        return self.manifest.get("version", "unknown")
-    
-    @property
-    def channel(self) -> str:
-        """Release channel (stable|beta|dev)."""
-        return self.manifest.get("channel", "unknown")
-    
-    @property
-    def hw_family(self) -> str:
-        """Hardware family (edge101, etc.)."""
-        return self.manifest.get("hw_family", "unknown")
-    
-    @property
-    def sha256(self) -> str:
-        """Expected SHA256 checksum."""
-        return self.manifest.get("sha256", "")
-    
-    @property
-    def esphome_min(self) -> str:
-        """Minimum ESPHome version required."""
-        return self.manifest.get("esphome_min", "0.0.0")
+        self.version: str = manifest.get("version", "unknown")
+        self.channel: str = manifest.get("channel", "unknown")
+        self.hw_family: str = manifest.get("hw_family", "unknown")
+        self.sha256: str = manifest.get("sha256", "")
+        self.esphome_min: str = manifest.get("esphome_min", "0.0.0")
+        self.computed_sha256 = computed_sha256
+        # Set by verify_artifact() once the SHA256 check passed
+        self.verified = False
 
 
 async def download_artifact(
+    session: aiohttp.ClientSession,
     version: str,
     hw_family: str,
     temp_dir: Path,
@@ -71,6 +114,7 @@ async def download_artifact(
     """Download firmware artifact from GitHub Releases.
     
     Args:
+        session: Shared aiohttp session (keepalive pool reused across GETs)
         version: Firmware version (e.g., "1.0.3")
         hw_family: Hardware family (e.g., "edge101")
         temp_dir: Temporary directory for downloads
@@ -112,67 +156,88 @@ async def download_artifact(
     try:
         # aiohttp follows redirects by default (allow_redirects=True)
         # GitHub Releases return 302 → release-assets CDN URL
-        async with aiohttp.ClientSession() as session:
-            # Download manifest.json
-            _LOGGER.debug("Downloading manifest: %s", manifest_url)
-            async with session.get(
-                manifest_url,
-                timeout=aiohttp.ClientTimeout(total=30),
-                allow_redirects=True  # Explicit: follow GitHub 302 redirects
-            ) as resp:
-                if resp.status != 200:
-                    raise ArtifactError(
-                        f"Manifest download failed: {resp.status} {resp.reason}"
-                    )
-                manifest_data = await resp.text()
-                manifest = json.loads(manifest_data)
-            
-            # Validate manifest schema
-            required_fields = ["version", "channel", "hw_family", "sha256"]
-            missing = [f for f in required_fields if f not in manifest]
-            if missing:
+        # Session is shared, so the firmware GET reuses the manifest connection
+        
+        # Download manifest.json
+        _LOGGER.debug("Downloading manifest: %s", manifest_url)
+        async with session.get(
+            manifest_url,
+            timeout=MANIFEST_TIMEOUT,
+            allow_redirects=True  # Explicit: follow GitHub 302 redirects
+        ) as resp:
+            if resp.status != 200:
                 raise ArtifactError(
-                    f"Invalid manifest: missing fields {missing}"
+                    f"Manifest download failed: {resp.status} {resp.reason}"
                 )
-            
-            # HARD REQUIREMENT: hw_family must match (safety check)
-            manifest_hw_family = manifest.get("hw_family")
-            if manifest_hw_family != hw_family:
+            # Parse raw bytes with HA's orjson-backed loader (no text decode)
+            manifest_data = await resp.read()
+            manifest = json_loads(manifest_data)
+        
+        if not isinstance(manifest, dict):
+            raise ArtifactError("Invalid manifest: expected a JSON object")
+        
+        # Validate manifest schema (single set difference against the keys)
+        missing = _REQUIRED_MANIFEST_FIELDS - manifest.keys()
+        if missing:
+            raise ArtifactError(
+                f"Invalid manifest: missing fields {sorted(missing)}"
+            )
+        
+        # HARD REQUIREMENT: hw_family must match (safety check)
+        manifest_hw_family = manifest.get("hw_family")
+        if manifest_hw_family != hw_family:
+            raise ArtifactError(
+                f"Hardware family mismatch: expected '{hw_family}', "
+                f"manifest declares '{manifest_hw_family}'"
+            )
+        
+        # Download firmware.bin
+        firmware_path = temp_dir / "firmware.bin"
+        _LOGGER.debug("Downloading firmware: %s → %s", firmware_url, firmware_path)
+        
+        async with session.get(
+            firmware_url,
+            timeout=FIRMWARE_TIMEOUT,
+            allow_redirects=True  # Explicit: follow GitHub 302 redirects
+        ) as resp:
+            if resp.status != 200:
                 raise ArtifactError(
-                    f"Hardware family mismatch: expected '{hw_family}', "
-                    f"manifest declares '{manifest_hw_family}'"
-                )
-            
-            # Download firmware.bin
-            firmware_path = temp_dir / "firmware.bin"
-            _LOGGER.debug("Downloading firmware: %s → %s", firmware_url, firmware_path)
-            
-            async with session.get(
-                firmware_url,
-                timeout=aiohttp.ClientTimeout(total=180),
-                allow_redirects=True  # Explicit: follow GitHub 302 redirects
-            ) as resp:
-                if resp.status != 200:
-                    raise ArtifactError(
-                        f"Firmware download failed: {resp.status} {resp.reason}"
-                    )
-                
-                firmware_data = await resp.read()
-                await asyncio.get_event_loop().run_in_executor(
-                    None, firmware_path.write_bytes, firmware_data
+                    f"Firmware download failed: {resp.status} {resp.reason}"
                 )
             
-            _LOGGER.info(
-                "Downloaded firmware: %d bytes → %s",
-                len(firmware_data),
-                firmware_path
-            )
+            # Stream to disk in chunks (no full in-memory copy) and
+            # hash in the same pass so verify_artifact needs no re-read.
+            # Hash + write are fused into one executor job per chunk, so
+            # each chunk is touched once and hashing stays off the loop.
+            loop = asyncio.get_running_loop()
+            sha256 = hashlib.sha256()
+            firmware_size = 0
+            fh = await loop.run_in_executor(_ARTIFACT_EXECUTOR, firmware_path.open, "wb")
             
-            # Create artifact
-            artifact = FirmwareArtifact(manifest, firmware_path)
+            def _hash_and_write(chunk: bytes) -> None:
+                sha256.update(chunk)
+                fh.write(chunk)
             
-            return artifact
-    
+            try:
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    firmware_size += len(chunk)
+                    await loop.run_in_executor(_ARTIFACT_EXECUTOR, _hash_and_write, chunk)
+            finally:
+                await loop.run_in_executor(_ARTIFACT_EXECUTOR, fh.close)
+        
+        _LOGGER.info(
+            "Downloaded firmware: %d bytes → %s",
+            firmware_size,
+            firmware_path
+        )
+        
+        # Create artifact
+        artifact = FirmwareArtifact(
+            manifest, firmware_path, computed_sha256=sha256.hexdigest()
+        )
+        
+        return artifact
+
     except aiohttp.ClientError as e:
         raise ArtifactError(f"Network error during download: {e}") from e
     except json.JSONDecodeError as e:
@@ -181,6 +246,27 @@ async def download_artifact(
         raise ArtifactError(f"File I/O error: {e}") from e
 
 
+def _sha256_file(path: Path) -> str:
+    """Compute SHA256 of a file in 1 MiB reads (blocking, run in executor).
+    
+    hashlib dispatches to OpenSSL (SHA-NI accelerated where available) and
+    releases the GIL for large updates; readinto reuses a single buffer.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    buf = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
 async def verify_artifact(artifact: FirmwareArtifact) -> bool:
     """Verify firmware artifact integrity (SHA256).
     
@@ -196,17 +282,13 @@ async def verify_artifact(artifact: FirmwareArtifact) -> bool:
     _LOGGER.info("Verifying firmware integrity: %s", artifact.firmware_path)
     
     try:
-        # Compute SHA256 of downloaded firmware (in executor to avoid blocking)
-        def _compute_sha256(path: Path) -> str:
-            sha256 = hashlib.sha256()
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-        
-        calculated = await asyncio.get_event_loop().run_in_executor(
-            None, _compute_sha256, artifact.firmware_path
-        )
+        # Prefer the digest computed while streaming the download (pure
+        # string compare, no I/O); re-hash from disk only if it is missing
+        calculated = artifact.computed_sha256
+        if calculated is None:
+            calculated = await asyncio.get_running_loop().run_in_executor(
+                _ARTIFACT_EXECUTOR, _sha256_file, artifact.firmware_path
+            )
         expected = artifact.sha256
         
         if calculated != expected:
@@ -220,12 +302,120 @@ async def verify_artifact(artifact: FirmwareArtifact) -> bool:
             )
         
         _LOGGER.info("Firmware integrity verified: SHA256 OK")
+        artifact.verified = True
         return True
     
     except OSError as e:
         raise ArtifactError(f"Cannot read firmware file: {e}") from e
 
 
+class FirmwareCache:
+    """On-disk cache of verified firmware artifacts.
+    
+    Fetch once, flash many: consecutive flashes of the same version (e.g. a
+    fleet of sibling devices) reuse the already downloaded and verified
+    binary. Entries are keyed "{hw_family}-{channel}-{version}" and evicted
+    LRU beyond max_entries.
+    """
+    
+    def __init__(self, cache_dir: Path, max_entries: int = 2):
+        """Initialize firmware cache.
+        
+        Args:
+            cache_dir: Directory holding one subdirectory per cached version
+            max_entries: Number of versions to keep on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, FirmwareArtifact] = OrderedDict()
+    
+    async def get_or_download(
+        self,
+        session: aiohttp.ClientSession,
+        version: str,
+        hw_family: str,
+        channel: str = "stable",
+        owner: str | None = None,
+        repo: str | None = None,
+    ) -> FirmwareArtifact:
+        """Return a verified artifact, downloading it only on cache miss.
+        
+        Args:
+            session: Shared aiohttp session
+            version: Firmware version (e.g., "1.0.3")
+            hw_family: Hardware family (e.g., "edge101")
+            channel: Release channel (stable|beta|dev)
+            owner: GitHub owner (overrides const.py default)
+            repo: GitHub repo (overrides const.py default)
+            
+        Returns:
+            FirmwareArtifact with verified set
+            
+        Raises:
+            ArtifactError: If download or verification fails
+        """
+        key = f"{hw_family}-{channel}-{version}"
+        loop = asyncio.get_running_loop()
+        
+        artifact = self._entries.get(key)
+        if artifact is not None:
+            if await loop.run_in_executor(
+                _ARTIFACT_EXECUTOR, artifact.firmware_path.is_file
+            ):
+                self._entries.move_to_end(key)
+                _LOGGER.info("Firmware cache hit: %s", key)
+                return artifact
+            # Binary vanished from disk — drop entry and re-download
+            del self._entries[key]
+        
+        entry_dir = self.cache_dir / key
+        await loop.run_in_executor(
+            _ARTIFACT_EXECUTOR, _prepare_dir, entry_dir
+        )
+        
+        try:
+            artifact = await download_artifact(
+                session,
+                version=version,
+                hw_family=hw_family,
+                temp_dir=entry_dir,
+                channel=channel,
+                owner=owner,
+                repo=repo,
+            )
+            # Never cache an unverified binary
+            await verify_artifact(artifact)
+        except BaseException:
+            await loop.run_in_executor(
+                _ARTIFACT_EXECUTOR, shutil.rmtree, entry_dir, True
+            )
+            raise
+        
+        self._entries[key] = artifact
+        
+        # LRU eviction + prune directories left over from previous runs
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        await loop.run_in_executor(
+            _ARTIFACT_EXECUTOR, _prune_dirs, self.cache_dir, set(self._entries)
+        )
+        
+        return artifact
+
+
+def _prepare_dir(path: Path) -> None:
+    """Create an empty directory (blocking, run in executor)."""
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _prune_dirs(cache_dir: Path, keep: set[str]) -> None:
+    """Remove cache subdirectories not in keep (blocking, run in executor)."""
+    for child in cache_dir.iterdir():
+        if child.name not in keep:
+            shutil.rmtree(child, ignore_errors=True)
+
+
 def get_latest_version(hw_family: str, channel: str = "stable") -> str:
     """Get latest firmware version for hardware family.
     
@@ -3,20 +3,35 @@
 Phase 3: EXECUTE Actions via button press.
 MVP: I (Discover), J (Flash) implemented first.
 """
+import asyncio
 import logging
-import tempfile
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 
-from .const import DOMAIN
-from .artifacts import download_artifact, verify_artifact, get_latest_version, ArtifactError
+from .const import DOMAIN, ENTITY_DEVICE_SELECTOR, ENTITY_STATUS_SENSOR
+from .artifacts import verify_artifact, get_latest_version, ArtifactError
+from .flash_guards import (
+    check_flash_guards,
+    collect_gate_attrs,
+    format_guard_block_message,
+)
+from .gates import GatesSnapshot, QualityGateChecker
 from .flash_uploader import (
     ota_upload,
     resolve_device_ip,
@@ -37,6 +52,230 @@ ENTITY_BUTTON_RESTART = "pvautonomy_ops_restart_device"
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class FlashState:
+    """Flash stage machine state for one flash operation."""
+
+    target_device: str
+    stage: str = "init"
+    version: str | None = None
+    error: str | None = None
+    artifact_path: str | None = None
+    # Last (stage, progress) pushed to the status sensor
+    fired_stage: str | None = None
+    fired_progress: int = -10
+
+
+# Keyword matchers for restart / reboot-monitor entity discovery (one regex
+# pass per entity_id instead of k substring tests; entity_ids are lowercase
+# by HA contract, so no .lower() is needed on them)
+_RESTART_RE = re.compile(r"restart|neustart|reboot")
+_MONITOR_RE = re.compile(r"uptime|health|wifi")
+
+# Restart entity naming conventions: (domain, suffix after "{device}"),
+# tried in order
+_RESTART_PATTERNS: tuple[tuple[str, str], ...] = (
+    # Switches (ESPHome often uses switches for restart)
+    ("switch", "_restart"),
+    ("switch", "_restart_device"),
+    ("switch", "_reboot"),
+    ("switch", "_neustart"),  # German ESPHome default
+    ("switch", "_restart_esp"),
+    # Buttons (newer ESPHome versions)
+    ("button", "_restart"),
+    ("button", "_restart_device"),
+    ("button", "_reboot"),
+)
+# Same suffixes as one alternation, for single-pass registry matching
+_RESTART_SUFFIX_RE: Final = "(?:{})".format(
+    "|".join(sorted({re.escape(suffix[1:]) for _, suffix in _RESTART_PATTERNS}))
+)
+
+# Gate result keys mirrored into button attributes and the gates event
+_GATE_SUMMARY_KEYS: Final = (
+    "last_result",
+    "gates_total",
+    "gates_passed",
+    "gates_failed",
+    "gates_warned",
+    "failed_gates",
+    "warned_gates",
+)
+
+# Monitor entity states that mean "device not reachable"
+_UNAVAILABLE: Final = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+
+def _add_monitor_candidate(candidates: dict[str, str], entity_id: str) -> None:
+    """Record entity_id as uptime/health/wifi monitor candidate (first wins).
+    
+    Args:
+        candidates: Dict mapping monitor type to entity_id (updated in place)
+        entity_id: sensor/binary_sensor entity_id to classify
+    """
+    if _MONITOR_RE.search(entity_id) is None:
+        return
+    if entity_id.startswith("sensor."):
+        if "uptime" in entity_id:
+            candidates.setdefault("uptime", entity_id)
+        elif "wifi" in entity_id:
+            candidates.setdefault("wifi", entity_id)
+    elif entity_id.startswith("binary_sensor.") and "health" in entity_id:
+        candidates.setdefault("health", entity_id)
+
+
+class DeviceEntityIndex:
+    """Device name → registry entity lookups shared by the device buttons.
+    
+    Resolves a device name (e.g. "sph10k_haus_03") to its registry device
+    once and picks its postcheck monitor entities, for both the Flash and
+    Restart buttons.  A single entity registry listener drops the cached
+    lookups and notifies the buttons so they can drop caches built on them.
+    """
+
+    __slots__ = ("_hass", "_device_ids", "_monitor_candidates", "_listeners")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index.
+        
+        Args:
+            hass: Home Assistant instance
+        """
+        self._hass = hass
+        # Device name → device registry id (None = no registry device found)
+        self._device_ids: dict[str, str | None] = {}
+        # Device name → {"uptime": eid, "health": eid, "wifi": eid}
+        self._monitor_candidates: dict[str, dict[str, str]] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking entity registry changes.
+        
+        Returns:
+            Callback that stops tracking (for entry.async_on_unload)
+        """
+        return self._hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_updated
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback whenever the cached lookups are dropped.
+        
+        Args:
+            update_callback: Invalidates the caller's derived caches
+            
+        Returns:
+            Callback that removes the listener
+        """
+        self._listeners.append(update_callback)
+        
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+        
+        return remove_listener
+
+    @callback
+    def _handle_registry_updated(self, _event: Event) -> None:
+        """Drop cached lookups (entities added/removed/renamed)."""
+        self._device_ids.clear()
+        self._monitor_candidates.clear()
+        for update_callback in self._listeners:
+            update_callback()
+
+    def device_entries(self, device_name: str) -> list[er.RegistryEntry] | None:
+        """Get entity registry entries of the device behind a device name.
+        
+        The registry device is resolved once (first entity whose entity_id
+        carries the "{device}_" prefix) and cached; its enabled entities are
+        then fetched via the registry's per-device index.
+        
+        Args:
+            device_name: Device identifier (e.g., "sph10k_haus_03")
+            
+        Returns:
+            Registry entries of the device, or None if the device is not in
+            the registry (callers fall back to scanning states)
+        """
+        ent_reg = er.async_get(self._hass)
+        if device_name in self._device_ids:
+            device_id = self._device_ids[device_name]
+        else:
+            device_id = None
+            marker = f".{device_name}_"
+            for entry in ent_reg.entities.values():
+                if entry.device_id is not None and marker in entry.entity_id:
+                    device_id = entry.device_id
+                    break
+            self._device_ids[device_name] = device_id
+        
+        if device_id is None:
+            return None
+        return er.async_entries_for_device(ent_reg, device_id)
+
+    def monitor_candidates(self, device_name: str) -> dict[str, str]:
+        """Pick uptime/health/wifi monitor entities of a device (cached).
+        
+        Uses the device's enabled registry entities; devices unknown to the
+        registry (e.g. template/YAML sensors) fall back to a scan of
+        sensor/binary_sensor states whose entity_id contains device_name.
+        
+        Args:
+            device_name: Device identifier (e.g., "sph10k_haus_03")
+            
+        Returns:
+            Dict mapping monitor type (uptime|health|wifi) to entity_id
+        """
+        candidates = self._monitor_candidates.get(device_name)
+        if candidates is not None:
+            return candidates
+        
+        entries = self.device_entries(device_name)
+        if entries is not None:
+            monitor_ids = (
+                entry.entity_id
+                for entry in entries
+                if entry.domain in ("sensor", "binary_sensor")
+            )
+        else:
+            monitor_ids = (
+                entity_id
+                for entity_id in self._hass.states.async_entity_ids(("sensor", "binary_sensor"))
+                if device_name in entity_id
+            )
+        
+        # Single prioritized pass, stopping at the first uptime sensor
+        candidates = {}
+        for entity_id in monitor_ids:
+            _add_monitor_candidate(candidates, entity_id)
+            if "uptime" in candidates:
+                break  # Highest priority found, rest are never used
+        
+        self._monitor_candidates[device_name] = candidates
+        return candidates
+
+    def select_monitor(self, device_name: str) -> tuple[str | None, str | None]:
+        """Pick the reboot monitor of a device: uptime, then health, then wifi.
+        
+        Args:
+            device_name: Device identifier (e.g., "sph10k_haus_03")
+            
+        Returns:
+            Tuple of (entity_id, monitor type) or (None, None) if none found
+        """
+        candidates = self.monitor_candidates(device_name)
+        for candidate_type in ("uptime", "health", "wifi"):
+            if candidate_type in candidates:
+                return candidates[candidate_type], candidate_type
+        return None, None
+
+
+# Max age (seconds) of the press-time guard check reused by flash preflight
+GUARDS_RESULT_MAX_AGE = 2.0
+
+
 async def check_gates_passed(hass: HomeAssistant) -> tuple[bool, str]:
     """Check if quality gates have passed (hard rule for critical actions).
     
@@ -53,23 +292,27 @@ async def check_gates_passed(hass: HomeAssistant) -> tuple[bool, str]:
             raise ValueError(error)
     """
     # Read sensor.pvautonomy_ops_status gates attributes
-    status_sensor = hass.states.get("sensor.pvautonomy_ops_status")
+    status_sensor = hass.states.get(ENTITY_STATUS_SENSOR)
     
-    if not status_sensor:
+    if status_sensor is None:
         return False, "Status sensor not available (run gates first)"
     
-    gates_overall = status_sensor.attributes.get("gates_overall")
-    gates_last_run = status_sensor.attributes.get("gates_last_run")
+    attrs = status_sensor.attributes
+    gates_overall = attrs.get("gates_overall")
     
     if not gates_overall:
         return False, "Quality gates have not been run (press 'Run Gates' button first)"
     
     if gates_overall == "fail":
-        failed_gates = status_sensor.attributes.get("gates_fail", [])
+        failed_gates = attrs.get("gates_fail", ())
         return False, f"Quality gates FAILED: {', '.join(failed_gates)} (fix issues or override)"
     
     # warn is allowed (user decision), only fail blocks
-    _LOGGER.info("Quality gates check: %s (last run: %s)", gates_overall, gates_last_run)
+    _LOGGER.info(
+        "Quality gates check: %s (last run: %s)",
+        gates_overall,
+        attrs.get("gates_last_run"),
+    )
     return True, ""
 
 
@@ -79,43 +322,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up PVAutonomy Ops buttons from a ConfigEntry."""
-    _LOGGER.info("Setting up PVAutonomy Ops buttons (ConfigEntry)")
+    _LOGGER.debug("Setting up PVAutonomy Ops buttons (ConfigEntry)")
 
-    operation_runner = hass.data[DOMAIN]["operation_runner"]
-    input_reader = hass.data[DOMAIN]["input_reader"]
-
-    async_add_entities(
-        [
-            PVAutonomyOpsDiscoverButton(hass, operation_runner, input_reader),
-            PVAutonomyOpsRestartButton(hass, operation_runner, input_reader),
-            PVAutonomyOpsRunGatesButton(hass, operation_runner, input_reader),
-            PVAutonomyOpsFlashButton(hass, operation_runner, input_reader),
-        ],
-        True,
-    )
+    domain_data = hass.data[DOMAIN]
+    operation_runner = domain_data["operation_runner"]
+    input_reader = domain_data["input_reader"]
 
-
-async def async_setup_platform(
-    hass: HomeAssistant,
-    config: ConfigType,
-    async_add_entities: AddEntitiesCallback,
-    discovery_info: DiscoveryInfoType | None = None,
-) -> None:
-    """Set up PVAutonomy Ops buttons (legacy YAML, kept for backward compat)."""
-    _LOGGER.info("Setting up PVAutonomy Ops buttons (YAML platform)")
-
-    operation_runner = hass.data[DOMAIN]["operation_runner"]
-    input_reader = hass.data[DOMAIN]["input_reader"]
+    # One device → entity index (and registry listener) for Flash + Restart
+    entity_index = DeviceEntityIndex(hass)
+    entry.async_on_unload(entity_index.async_start())
 
     async_add_entities(
         [
             PVAutonomyOpsDiscoverButton(hass, operation_runner, input_reader),
-            PVAutonomyOpsRestartButton(hass, operation_runner, input_reader),
+            PVAutonomyOpsRestartButton(
+                hass, operation_runner, input_reader, entity_index
+            ),
             PVAutonomyOpsRunGatesButton(hass, operation_runner, input_reader),
-            # Phase 3.3: Flash button with guard protection (D-ADDON-FLASH-GUARD-001)
-            PVAutonomyOpsFlashButton(hass, operation_runner, input_reader),
-        ],
-        True,
+            PVAutonomyOpsFlashButton(
+                hass, operation_runner, input_reader, entity_index
+            ),
+        ]
     )
 
 
@@ -130,6 +357,7 @@ class PVAutonomyOpsDiscoverButton(ButtonEntity):
     _attr_unique_id = ENTITY_BUTTON_DISCOVER
     _attr_suggested_object_id = ENTITY_BUTTON_DISCOVER
     _attr_icon = "mdi:magnify-scan"
+    _attr_should_poll = False
 
     def __init__(self, hass: HomeAssistant, operation_runner, input_reader) -> None:
         """Initialize discover button.
@@ -142,13 +370,24 @@ class PVAutonomyOpsDiscoverButton(ButtonEntity):
         self.hass = hass
         self.operation_runner = operation_runner
         self.input_reader = input_reader
-        
-        self._attr_extra_state_attributes = {
-            "last_result": None,
-            "devices_found": None,
-            "duration_ms": None,
-            "error_message": None,
-        }
+        # Entry-scoped shared objects (same dict for the entry's lifetime;
+        # "config" inside it is swapped on hot-applied option changes)
+        self._domain_data: dict[str, Any] = hass.data[DOMAIN]
+        
+        # Dropdown list last written to the selector (skip unchanged writes)
+        self._dropdown_items: list[dict[str, str]] | None = None
+        
+        # Mutated in place on each press (no per-press dict allocation)
+        self._attr_extra_state_attributes = dict.fromkeys(
+            (
+                "last_result",
+                "devices_found",
+                "factory_count",
+                "production_count",
+                "duration_ms",
+                "error_message",
+            )
+        )
 
     async def async_press(self) -> None:
         """Handle button press (Action A: Discover Devices).
@@ -165,20 +404,19 @@ class PVAutonomyOpsDiscoverButton(ButtonEntity):
         
         # Update button attributes with result
         discover_result = result.get("result", {})
-        self._attr_extra_state_attributes = {
-            "last_result": "success" if result["success"] else "error",
-            "devices_found": discover_result.get("devices_found"),
-            "factory_count": discover_result.get("factory_count", 0),
-            "production_count": discover_result.get("production_count", 0),
-            "duration_ms": result["duration_ms"],
-            "error_message": result.get("error"),
-        }
+        attrs = self._attr_extra_state_attributes
+        attrs["last_result"] = "success" if result["success"] else "error"
+        attrs["devices_found"] = discover_result.get("devices_found")
+        attrs["factory_count"] = discover_result.get("factory_count", 0)
+        attrs["production_count"] = discover_result.get("production_count", 0)
+        attrs["duration_ms"] = result["duration_ms"]
+        attrs["error_message"] = result.get("error")
         
         # Trigger update
         self.async_write_ha_state()
         
         # Trigger status sensor update to reflect new last_discovery timestamp
-        self.hass.bus.async_fire(f"{DOMAIN}_update")
+        await self._domain_data["coordinator"].async_request_refresh()
         
         _LOGGER.info(
             "Discover completed: %s devices, duration=%dms",
@@ -197,8 +435,8 @@ class PVAutonomyOpsDiscoverButton(ButtonEntity):
                 - devices_found: int
                 - factory_count: int
                 - production_count: int
-                - factory_devices: list[dict]
-                - production_devices: list[dict]
+                - factory_devices: list[RegistryDevice]
+                - production_devices: list[RegistryDevice]
         """
         # Primary: Device Registry scan (Factory + Production)
         registry_devices = await self.input_reader.get_registry_devices()
@@ -211,26 +449,38 @@ class PVAutonomyOpsDiscoverButton(ButtonEntity):
         legacy_devices = await self.input_reader.get_discovered_devices()
         
         # Populate dropdown with merged device list
-        dropdown_items = await self.input_reader.get_all_devices_for_dropdown()
+        dropdown_items = await self.input_reader.get_all_devices_for_dropdown(
+            registry_devices, legacy_devices
+        )
         if dropdown_items:
             options = ["none"] + [item["value"] for item in dropdown_items]
-            try:
-                await self.hass.services.async_call(
-                    "input_select",
-                    "set_options",
-                    {
-                        "entity_id": "input_select.edge101_selected_production_device",
-                        "options": options,
-                    },
-                    blocking=True,
-                )
-                _LOGGER.info(
-                    "Dropdown updated with %d devices: %s",
-                    len(dropdown_items),
-                    options,
-                )
-            except Exception as err:
-                _LOGGER.warning("Failed to update dropdown: %s", err)
+            selector = self.hass.states.get(ENTITY_DEVICE_SELECTOR)
+            if (
+                dropdown_items is self._dropdown_items
+                and selector is not None
+                and selector.attributes.get("options") == options
+            ):
+                # Same list as last press and still applied: skip the write
+                _LOGGER.debug("Dropdown unchanged (%d devices)", len(dropdown_items))
+            else:
+                try:
+                    await self.hass.services.async_call(
+                        "input_select",
+                        "set_options",
+                        {
+                            "entity_id": ENTITY_DEVICE_SELECTOR,
+                            "options": options,
+                        },
+                        blocking=True,
+                    )
+                    self._dropdown_items = dropdown_items
+                    _LOGGER.info(
+                        "Dropdown updated with %d devices: %s",
+                        len(dropdown_items),
+                        options,
+                    )
+                except Exception as err:
+                    _LOGGER.warning("Failed to update dropdown: %s", err)
         
         return {
             "devices_found": total,
@@ -255,25 +505,62 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
     _attr_unique_id = ENTITY_BUTTON_FLASH
     _attr_suggested_object_id = ENTITY_BUTTON_FLASH
     _attr_icon = "mdi:download-box"
+    _attr_should_poll = False
 
-    def __init__(self, hass: HomeAssistant, operation_runner, input_reader) -> None:
+    # Attributes for the "no device selected" rejection (shared, read-only)
+    _NO_DEVICE_ATTRS: Final[Mapping[str, Any]] = MappingProxyType(
+        {
+            "target_device": None,
+            "last_result": "rejected",
+            "firmware_version": None,
+            "flash_duration_sec": None,
+            "error_message": "No device selected",
+            "block_reason": None,
+        }
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        operation_runner,
+        input_reader,
+        entity_index: DeviceEntityIndex,
+    ) -> None:
         """Initialize flash button.
         
         Args:        hass: Home Assistant instance
             operation_runner: Operation runner with lock and tracking
             input_reader: Contract input reader
+            entity_index: Shared device → entity lookups (postcheck monitor)
         """
         self.hass = hass
         self.operation_runner = operation_runner
         self.input_reader = input_reader
-        
-        self._attr_extra_state_attributes = {
-            "target_device": None,
-            "last_result": None,
-            "firmware_version": None,
-            "flash_duration_sec": None,
-            "error_message": None,
-        }
+        self._entity_index = entity_index
+        # Entry-scoped shared objects (same dict for the entry's lifetime;
+        # "config" inside it is swapped on hot-applied option changes)
+        self._domain_data: dict[str, Any] = hass.data[DOMAIN]
+        
+        # Mutated in place on each press (no per-press dict allocation)
+        self._attr_extra_state_attributes = dict.fromkeys(
+            (
+                "target_device",
+                "last_result",
+                "firmware_version",
+                "flash_duration_sec",
+                "error_message",
+                "block_reason",
+            )
+        )
+        # Device → entity_id providing its IP (read fresh on every flash)
+        self._ip_entities: dict[str, str] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Invalidate cached IP entities when the entity registry changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._entity_index.async_add_listener(self._ip_entities.clear)
+        )
 
     async def async_press(self) -> None:
         """Handle button press (Action B: Flash Firmware).
@@ -281,28 +568,35 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
         Contract: ops-contract-v1.md Section 3.1 Action B
         Directive: D-ADDON-FLASH-GUARD-001 (mandatory gate checks)
         """
-        from .flash_guards import check_flash_guards, format_guard_block_message
-        
         _LOGGER.info("Flash button pressed")
+        try:
+            await self._async_handle_press(self._attr_extra_state_attributes)
+        finally:
+            # Single state write per press, whichever path was taken
+            self.async_write_ha_state()
+
+    async def _async_handle_press(self, attrs: dict[str, Any]) -> None:
+        """Run the flash press flow, updating attrs in place (no state write).
         
+        Args:
+            attrs: Button extra_state_attributes to update
+        """
         # Get selected device (legacy input_select)
         selected_device = await self.input_reader.get_selected_device()
         
-        if not selected_device or selected_device == "none":
+        if not selected_device:
             _LOGGER.warning("Flash blocked: no device selected")
-            self._attr_extra_state_attributes = {
-                "target_device": None,
-                "last_result": "rejected",
-                "firmware_version": None,
-                "flash_duration_sec": None,
-                "error_message": "No device selected",
-                "block_reason": None,
-            }
-            self.async_write_ha_state()
+            attrs.update(self._NO_DEVICE_ATTRS)
             return
         
-        # D-ADDON-FLASH-GUARD-001: Check preflight gates (MUST)
-        guards_passed, block_reason, guard_message = await check_flash_guards(self.hass)
+        # D-ADDON-FLASH-GUARD-001: Check preflight gates (MUST); the same
+        # gates snapshot / status sensor attrs serve the check and the
+        # block message
+        gates_snapshot: GatesSnapshot | None = self._domain_data.get("gates")
+        gate_attrs = collect_gate_attrs(self.hass)
+        guards_result = check_flash_guards(self.hass, gate_attrs)
+        guards_checked_at = self.hass.loop.time()
+        guards_passed, block_reason, guard_message = guards_result
         
         if not guards_passed:
             _LOGGER.warning(
@@ -312,64 +606,58 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
             )
             
             # Format user-friendly block message
-            block_message = await format_guard_block_message(self.hass, block_reason)
+            block_message = format_guard_block_message(
+                self.hass, block_reason, gate_attrs, gates_snapshot
+            )
             
-            self._attr_extra_state_attributes = {
-                "target_device": selected_device,
-                "last_result": "blocked",
-                "firmware_version": None,
-                "flash_duration_sec": None,
-                "error_message": block_message,
-                "block_reason": block_reason,  # Machine-readable
-            }
-            self.async_write_ha_state()
+            attrs["target_device"] = selected_device
+            attrs["last_result"] = "blocked"
+            attrs["firmware_version"] = None
+            attrs["flash_duration_sec"] = None
+            attrs["error_message"] = block_message
+            attrs["block_reason"] = block_reason  # Machine-readable
             
             # Also update status sensor to reflect block
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_update",
-                {
-                    "op_state": "blocked",
-                    "last_error": block_message,
-                    "block_reason": block_reason,
-                }
-            )
+            await self._domain_data["coordinator"].async_request_refresh()
             return
         
         # Guards passed - execute flash via operation runner
         result = await self.operation_runner.run(
             "flash_firmware",
             self._execute_flash,
-            selected_device
+            selected_device,
+            guards_result=guards_result,
+            guards_checked_at=guards_checked_at,
         )
         
         # Update button attributes (defensive None handling)
+        attrs["target_device"] = selected_device
+        attrs["block_reason"] = None
         if result is None:
             # Operation runner returned None (unexpected error)
-            self._attr_extra_state_attributes = {
-                "target_device": selected_device,
-                "last_result": "failed",
-                "firmware_version": None,
-                "flash_duration_sec": None,
-                "error_message": "Internal error: operation_runner returned None",
-                "block_reason": None,
-            }
+            attrs["last_result"] = "failed"
+            attrs["firmware_version"] = None
+            attrs["flash_duration_sec"] = None
+            attrs["error_message"] = "Internal error: operation_runner returned None"
         else:
-            self._attr_extra_state_attributes = {
-                "target_device": selected_device,
-                "last_result": "success" if result.get("success") else "failed",
-                "firmware_version": result.get("result", {}).get("firmware_version") if result.get("result") else None,
-                "flash_duration_sec": result["duration_ms"] // 1000 if result.get("duration_ms") else None,
-                "error_message": result.get("error"),
-                "block_reason": None,
-            }
-        
-        self.async_write_ha_state()
+            attrs["last_result"] = "success" if result.get("success") else "failed"
+            attrs["firmware_version"] = result.get("result", {}).get("firmware_version") if result.get("result") else None
+            attrs["flash_duration_sec"] = result["duration_ms"] // 1000 if result.get("duration_ms") else None
+            attrs["error_message"] = result.get("error")
 
-    async def _execute_flash(self, device_id: str) -> dict[str, Any]:
+    async def _execute_flash(
+        self,
+        device_id: str,
+        guards_result: tuple[bool, str, str] | None = None,
+        guards_checked_at: float | None = None,
+    ) -> dict[str, Any]:
         """Execute flash operation with stage machine (Phase 3.3 MVP).
         
         Args:
             device_id: Device entity ID to flash
+            guards_result: check_flash_guards() result from async_press
+                (reused by preflight if still fresh)
+            guards_checked_at: Loop time when guards_result was computed
             
         Returns:
             Dict with flash results
@@ -377,19 +665,24 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
         Stages:
             init → preflight → download → verify → upload → postcheck → complete/failed
         """
-        from .flash_guards import check_flash_guards
-        
         # Flash stage machine state (MVP)
-        flash_state = {
-            "stage": "init",
-            "version": None,
-            "target_device": device_id,
-            "error": None,
-        }
+        flash_state = FlashState(target_device=device_id)
         
         def update_stage(stage: str, progress: int):
-            """Update flash stage and trigger sensor refresh."""
-            flash_state["stage"] = stage
+            """Update flash stage and trigger sensor refresh.
+            
+            Coalesced: the bus event only fires on a stage change, a
+            progress advance of at least 5%, or a terminal stage.
+            """
+            flash_state.stage = stage
+            if (
+                stage == flash_state.fired_stage
+                and progress - flash_state.fired_progress < 5
+                and stage not in ("complete", "failed")
+            ):
+                return
+            flash_state.fired_stage = stage
+            flash_state.fired_progress = progress
             _LOGGER.info("Flash stage: %s (progress=%d%%)", stage, progress)
             
             # Trigger sensor update with flash stage info
@@ -398,9 +691,9 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 {
                     "stage": stage,
                     "progress": progress,
-                    "version": flash_state.get("version"),
+                    "version": flash_state.version,
                     "target_device": device_id,
-                    "error": flash_state.get("error"),  # Include error message for failed stage
+                    "error": flash_state.error,  # Include error message for failed stage
                 }
             )
         
@@ -410,22 +703,24 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
             
             # STAGE 2: preflight (10%)
             update_stage("preflight", 10)
-            guards_passed, block_reason, guard_message = await check_flash_guards(self.hass)
             
+            # Reuse the press-time guard result unless it has gone stale
+            if (
+                guards_result is None
+                or guards_checked_at is None
+                or self.hass.loop.time() - guards_checked_at > GUARDS_RESULT_MAX_AGE
+            ):
+                guards_result = check_flash_guards(self.hass)
+            guards_passed, _block_reason, guard_message = guards_result
             if not guards_passed:
-                flash_state["error"] = f"Preflight failed: {guard_message}"
+                flash_state.error = f"Preflight failed: {guard_message}"
                 update_stage("failed", 0)
-                raise ValueError(flash_state["error"])
-            
+                raise ValueError(flash_state.error)
             _LOGGER.info("Flash preflight PASSED")
             
-            # Prepare temp directory for artifacts
-            temp_dir = Path(tempfile.mkdtemp(prefix="pvautonomy_flash_"))
-            _LOGGER.debug("Created temp dir: %s", temp_dir)
-            
             try:
                 # Read runtime config (Options Flow values)
-                config = self.hass.data[DOMAIN].get("config", {})
+                config = self._domain_data["config"]
                 hw_family = config.get("artifact_hw_family_default", "edge101")
                 channel = config.get("artifact_channel", "stable")
                 min_size_kb = config.get("flash_min_firmware_size_kb", 300)
@@ -434,20 +729,21 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 update_stage("download", 30)
                 _LOGGER.info("Downloading firmware artifact...")
                 
-                # Download firmware from GitHub Releases
+                # Download firmware from GitHub Releases (or reuse the
+                # cached, already verified binary for this version)
                 # MVP: get version from artifacts module
                 firmware_version = get_latest_version(hw_family, channel)
-                artifact = await download_artifact(
+                artifact = await self._domain_data["fw_cache"].get_or_download(
+                    self._domain_data["http"],
                     version=firmware_version,
                     hw_family=hw_family,
-                    temp_dir=temp_dir,
                     channel=channel,
                     owner=config.get("artifact_owner"),
                     repo=config.get("artifact_repo"),
                 )
                 
-                flash_state["version"] = artifact.version
-                flash_state["artifact_path"] = str(artifact.firmware_path)
+                flash_state.version = artifact.version
+                flash_state.artifact_path = str(artifact.firmware_path)
                 firmware_size = artifact.firmware_path.stat().st_size
                 _LOGGER.info(
                     "Downloaded firmware: version=%s, size=%d bytes",
@@ -458,19 +754,20 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 # MIN_FIRMWARE_SIZE gate (P3-6-001): reject stub/corrupt binaries
                 min_size_bytes = min_size_kb * 1024
                 if firmware_size < min_size_bytes:
-                    flash_state["error"] = (
+                    flash_state.error = (
                         f"Firmware too small: {firmware_size} bytes "
                         f"(minimum {min_size_bytes} bytes / {min_size_kb} KB)"
                     )
                     update_stage("failed", 0)
-                    raise ValueError(flash_state["error"])
+                    raise ValueError(flash_state.error)
                 
                 # STAGE 4: verify (50%) - REAL IMPLEMENTATION
                 update_stage("verify", 50)
                 _LOGGER.info("Verifying firmware integrity (SHA256)...")
                 
-                # Verify SHA256 checksum
-                await verify_artifact(artifact)
+                # Verify SHA256 checksum (skipped for cache hits verified earlier)
+                if not artifact.verified:
+                    await verify_artifact(artifact)
                 
                 _LOGGER.info("Firmware integrity verified: SHA256 OK")
                 
@@ -479,23 +776,29 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 _LOGGER.info("Starting OTA upload to device: %s", device_id)
                 
                 # Resolve device IP from HA states (no hardcoded IPs)
-                device_ip = resolve_device_ip(self.hass, device_id)
+                device_ip = resolve_device_ip(self.hass, device_id, self._ip_entities)
                 if not device_ip:
-                    flash_state["error"] = f"Cannot resolve IP for device: {device_id}"
+                    flash_state.error = f"Cannot resolve IP for device: {device_id}"
                     update_stage("failed", 0)
-                    raise OTAError(flash_state["error"])
+                    raise OTAError(flash_state.error)
                 
-                # Get OTA password from secrets (no hardcoded passwords)
-                ota_password = await self.hass.async_add_executor_job(
-                    get_ota_password, self.hass, device_id
-                )
+                # Get OTA password from secrets (no hardcoded passwords);
+                # secrets.yaml is only read on a cache miss
+                ota_passwords = self._domain_data["ota_passwords"]
+                ota_password = ota_passwords.get(device_id)
+                if ota_password is None:
+                    ota_password = await self.hass.async_add_executor_job(
+                        get_ota_password, self.hass, device_id
+                    )
+                    if ota_password:
+                        ota_passwords[device_id] = ota_password
                 if not ota_password:
                     _LOGGER.warning("No OTA password found — attempting upload without auth")
                 
                 # Progress callback: map OTA 0-100% → flash 30-80%
-                async def _upload_progress(pct: int) -> None:
-                    flash_pct = 30 + int(pct * 0.5)
-                    update_stage("upload", flash_pct)
+                # (plain call on the loop, no coroutine per progress tick)
+                def _upload_progress(pct: int) -> None:
+                    update_stage("upload", 30 + (pct >> 1))
                 
                 # Execute OTA upload
                 await ota_upload(
@@ -514,39 +817,18 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 update_stage("postcheck", 85)
                 _LOGGER.info("Postcheck: waiting for device reboot...")
                 
-                import asyncio as _asyncio
-                
                 # Brief pause — device is rebooting after OTA
-                await _asyncio.sleep(3)
+                await asyncio.sleep(3)
                 
                 # Find monitoring sensor (uptime preferred, then health, then wifi)
-                monitor_entity = None
-                monitor_type = None
                 initial_uptime = None
-                
-                for eid in self.hass.states.async_entity_ids("sensor"):
-                    if device_id in eid and "uptime" in eid.lower():
-                        monitor_entity = eid
-                        monitor_type = "uptime"
-                        break
-                
-                if not monitor_entity:
-                    for eid in self.hass.states.async_entity_ids("binary_sensor"):
-                        if device_id in eid and "health" in eid.lower():
-                            monitor_entity = eid
-                            monitor_type = "health"
-                            break
-                
-                if not monitor_entity:
-                    for eid in self.hass.states.async_entity_ids("sensor"):
-                        if device_id in eid and "wifi" in eid.lower():
-                            monitor_entity = eid
-                            monitor_type = "wifi"
-                            break
+                monitor_entity, monitor_type = self._entity_index.select_monitor(
+                    device_id
+                )
                 
                 if monitor_entity:
                     init_state = self.hass.states.get(monitor_entity)
-                    if monitor_type == "uptime" and init_state and init_state.state not in ("unavailable", "unknown"):
+                    if monitor_type == "uptime" and init_state and init_state.state not in _UNAVAILABLE:
                         try:
                             initial_uptime = float(init_state.state)
                         except (ValueError, TypeError):
@@ -554,55 +836,92 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                     
                     _LOGGER.info("Postcheck monitoring via %s (%s)", monitor_entity, monitor_type)
                     
-                    # Poll for reboot detection (max 90s, every 2s)
-                    offline_detected = False
+                    # Event-driven reboot detection (max 90s): react to state
+                    # transitions of the monitor entity instead of polling
                     max_wait = 90
-                    elapsed = 0
+                    start = self.hass.loop.time()
+                    reboot_event = asyncio.Event()
+                    offline_detected = (
+                        init_state is None
+                        or init_state.state in _UNAVAILABLE
+                    )
+                    if offline_detected:
+                        _LOGGER.info("Postcheck: device offline (elapsed=0s)")
                     
-                    while elapsed < max_wait:
-                        await _asyncio.sleep(2)
-                        elapsed += 2
-                        
-                        # Update progress: 85→95% over polling period
-                        poll_pct = 85 + int((elapsed / max_wait) * 10)
-                        update_stage("postcheck", min(poll_pct, 95))
-                        
-                        cur_state = self.hass.states.get(monitor_entity)
-                        if not cur_state:
-                            continue
+                    # Last uptime string found not to be a reset (parsed once)
+                    checked_uptime = init_state.state if initial_uptime is not None else None
+                    
+                    @callback
+                    def _monitor_changed(event: Event) -> None:
+                        nonlocal offline_detected, checked_uptime
+                        cur_state = event.data["new_state"]
+                        if cur_state is None:
+                            return
+                        state_val = cur_state.state
+                        # Attribute-only update: nothing to re-evaluate
+                        old_state = event.data["old_state"]
+                        if old_state is not None and old_state.state == state_val:
+                            return
                         
-                        cur_available = cur_state.state not in ("unavailable", "unknown")
+                        elapsed = int(self.hass.loop.time() - start)
+                        cur_available = state_val not in _UNAVAILABLE
                         
                         # Method 1: Detect offline transition
                         if not offline_detected and not cur_available:
                             offline_detected = True
                             _LOGGER.info("Postcheck: device offline (elapsed=%ds)", elapsed)
+                            return
                         
-                        # Method 2: Uptime reset (device rebooted)
-                        if monitor_type == "uptime" and cur_available and initial_uptime is not None:
+                        # Method 2: Uptime reset (device rebooted); initial_uptime
+                        # is only set for uptime monitors with a numeric baseline
+                        if (
+                            initial_uptime is not None
+                            and cur_available
+                            and state_val != checked_uptime
+                        ):
                             try:
-                                cur_uptime = float(cur_state.state)
+                                cur_uptime = float(state_val)
+                            except (ValueError, TypeError):
+                                pass
+                            else:
                                 if cur_uptime < initial_uptime:
                                     _LOGGER.info(
                                         "Postcheck: uptime reset %.1fs→%.1fs (reboot confirmed)",
                                         initial_uptime, cur_uptime
                                     )
-                                    break
-                            except (ValueError, TypeError):
-                                pass
+                                    reboot_event.set()
+                                    return
+                                checked_uptime = state_val
                         
                         # Method 3: Online after offline
                         if offline_detected and cur_available:
                             _LOGGER.info("Postcheck: device back online (elapsed=%ds)", elapsed)
-                            break
-                    else:
+                            reboot_event.set()
+                    
+                    unsub_state = async_track_state_change_event(
+                        self.hass, [monitor_entity], _monitor_changed
+                    )
+                    # Single intermediate progress tick halfway through the wait
+                    unsub_progress = async_call_later(
+                        self.hass,
+                        max_wait / 2,
+                        lambda _now: update_stage("postcheck", 90),
+                    )
+                    try:
+                        await asyncio.wait_for(reboot_event.wait(), timeout=max_wait)
+                    except asyncio.TimeoutError:
                         if offline_detected:
                             _LOGGER.warning("Postcheck: device offline but not back within %ds", max_wait)
                         else:
                             _LOGGER.warning("Postcheck: no reboot detected within %ds", max_wait)
+                    finally:
+                        unsub_state()
+                        unsub_progress()
+                    
+                    update_stage("postcheck", 95)
                 else:
                     _LOGGER.warning("Postcheck: no monitoring sensor found, waiting 15s as fallback")
-                    await _asyncio.sleep(15)
+                    await asyncio.sleep(15)
                 
                 _LOGGER.info("Postcheck complete")
                 
@@ -610,52 +929,39 @@ class PVAutonomyOpsFlashButton(ButtonEntity):
                 update_stage("complete", 100)
                 _LOGGER.info(
                     "Flash operation complete: version=%s, device=%s",
-                    flash_state["version"],
+                    flash_state.version,
                     device_id
                 )
                 
-                # Micro-regression guard: Ensure stage is never unset on success path
-                if not flash_state.get("stage") or flash_state["stage"] not in ["complete"]:
-                    _LOGGER.warning(
-                        "Flash stage missing or invalid after completion (stage=%s), forcing 'complete'",
-                        flash_state.get("stage")
-                    )
-                    flash_state["stage"] = "complete"
-                    update_stage("complete", 100)  # Re-fire event to ensure sensor gets it
-                
                 return {
                     "result": "success",
                     "device_id": device_id,
-                    "firmware_version": flash_state["version"],
+                    "firmware_version": flash_state.version,
                     "flash_duration_sec": 0,  # Will be filled by operation_runner
                     "stage": "complete",
                 }
                 
             except ArtifactError as e:
-                flash_state["error"] = f"Artifact error: {e}"
+                flash_state.error = f"Artifact error: {e}"
                 update_stage("failed", 0)
                 _LOGGER.error("Artifact download/verify failed: %s", e)
                 raise
             
             except OTAError as e:
-                flash_state["error"] = f"OTA upload error: {e}"
+                # Re-read secrets on the next attempt (password may have changed)
+                self._domain_data["ota_passwords"].pop(device_id, None)
+                flash_state.error = f"OTA upload error: {e}"
                 update_stage("failed", 0)
                 _LOGGER.error("OTA upload failed: %s", e)
                 raise
-                
-            finally:
-                # Cleanup temp directory (success or failure, in executor to avoid blocking)
-                import shutil
-                import asyncio
-                await asyncio.get_event_loop().run_in_executor(
-                    None, shutil.rmtree, temp_dir, True
-                )
-                _LOGGER.debug("Cleaned up temp dir: %s", temp_dir)
             
         except Exception as e:
-            flash_state["error"] = str(e)
-            update_stage("failed", 0)
-            _LOGGER.error("Flash operation failed at stage %s: %s", flash_state["stage"], e)
+            # Failure paths that already fired "failed" keep their (more
+            # descriptive) error; only unhandled errors fire it here
+            if flash_state.stage != "failed":
+                flash_state.error = str(e)
+                update_stage("failed", 0)
+            _LOGGER.error("Flash operation failed at stage %s: %s", flash_state.stage, e)
             raise
 
 
@@ -666,31 +972,77 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
     NOT in Contract v1.0.0 (Phase 3 experimental feature).
     """
 
+    # Integration-owned members only: hass and _attr_* stay with the HA
+    # Entity machinery (ButtonEntity instances keep their __dict__)
+    __slots__ = (
+        "operation_runner",
+        "input_reader",
+        "_domain_data",
+        "_entity_index",
+        "_restart_entity_cache",
+    )
+
     _attr_name = "PVAutonomy Ops Restart Device"
     _attr_unique_id = ENTITY_BUTTON_RESTART
     _attr_suggested_object_id = ENTITY_BUTTON_RESTART
     _attr_icon = "mdi:restart"
+    _attr_should_poll = False
 
-    def __init__(self, hass: HomeAssistant, operation_runner, input_reader) -> None:
+    # Attributes for the "no device selected" rejection (shared, read-only)
+    _NO_DEVICE_ATTRS: Final[Mapping[str, Any]] = MappingProxyType(
+        {
+            "target_device": None,
+            "last_result": "rejected",
+            "restart_duration_sec": None,
+            "offline_detected": None,
+            "online_detected": None,
+            "error_message": "No device selected",
+        }
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        operation_runner,
+        input_reader,
+        entity_index: DeviceEntityIndex,
+    ) -> None:
         """Initialize restart button.
         
         Args:
             hass: Home Assistant instance
             operation_runner: Operation runner with lock and tracking
             input_reader: Contract input reader
+            entity_index: Shared device → entity lookups (restart + monitor)
         """
         self.hass = hass
         self.operation_runner = operation_runner
         self.input_reader = input_reader
-        
-        self._attr_extra_state_attributes = {
-            "target_device": None,
-            "last_result": None,
-            "restart_duration_sec": None,
-            "offline_detected": None,
-            "online_detected": None,
-            "error_message": None,
-        }
+        self._entity_index = entity_index
+        # Entry-scoped shared objects (same dict for the entry's lifetime;
+        # "config" inside it is swapped on hot-applied option changes)
+        self._domain_data: dict[str, Any] = hass.data[DOMAIN]
+        
+        # Mutated in place on each press (no per-press dict allocation)
+        self._attr_extra_state_attributes = dict.fromkeys(
+            (
+                "target_device",
+                "last_result",
+                "restart_duration_sec",
+                "offline_detected",
+                "online_detected",
+                "error_message",
+            )
+        )
+        # Device name → discovered (restart entity_id, domain)
+        self._restart_entity_cache: dict[str, tuple[str, str]] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Invalidate cached restart entities when the entity registry changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._entity_index.async_add_listener(self._restart_entity_cache.clear)
+        )
 
     async def async_press(self) -> None:
         """Handle button press (Restart Device).
@@ -698,20 +1050,14 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
         Phase 3 Extension: Soft restart via ESPHome service.
         """
         _LOGGER.info("Restart button pressed")
+        attrs = self._attr_extra_state_attributes
         
         # Get selected device (legacy input_select)
         selected_device = await self.input_reader.get_selected_device()
         
-        if not selected_device or selected_device == "none":
+        if not selected_device:
             _LOGGER.warning("Restart blocked: no device selected")
-            self._attr_extra_state_attributes = {
-                "target_device": None,
-                "last_result": "rejected",
-                "restart_duration_sec": None,
-                "offline_detected": None,
-                "online_detected": None,
-                "error_message": "No device selected",
-            }
+            attrs.update(self._NO_DEVICE_ATTRS)
             self.async_write_ha_state()
             return
         
@@ -723,19 +1069,18 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
         )
         
         # Update button attributes
-        self._attr_extra_state_attributes = {
-            "target_device": selected_device,
-            "last_result": result.get("result", {}).get("status", "error"),
-            "restart_duration_sec": result["duration_ms"] // 1000 if result["duration_ms"] else None,
-            "offline_detected": result.get("result", {}).get("offline_detected"),
-            "online_detected": result.get("result", {}).get("online_detected"),
-            "error_message": result.get("error"),
-        }
+        restart_result = result.get("result", {})
+        attrs["target_device"] = selected_device
+        attrs["last_result"] = restart_result.get("status", "error")
+        attrs["restart_duration_sec"] = result["duration_ms"] // 1000 if result["duration_ms"] else None
+        attrs["offline_detected"] = restart_result.get("offline_detected")
+        attrs["online_detected"] = restart_result.get("online_detected")
+        attrs["error_message"] = result.get("error")
         
         self.async_write_ha_state()
         
         # Trigger status sensor update
-        self.hass.bus.async_fire(f"{DOMAIN}_update")
+        await self._domain_data["coordinator"].async_request_refresh()
 
     async def _execute_restart(self, device_entity_id: str) -> dict[str, Any]:
         """Execute restart logic with ESPHome service call.
@@ -752,8 +1097,6 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
                 - online_detected: ISO timestamp or None
                 - error: Error message if failed
         """
-        import asyncio
-        
         _LOGGER.info("Executing restart for device: %s", device_entity_id)
         
         # STEP 1: Find ESPHome restart entity (button or switch)
@@ -769,37 +1112,26 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
         
         _LOGGER.info("Found restart %s: %s", restart_domain, restart_entity)
         
-        # STEP 2: Find monitoring sensor (fuzzy matching, same as restart entity)
-        monitor_entity = None
-        monitor_type = None
-        
-        # Try to find uptime sensor (preferred for reboot detection)
-        for entity_id in self.hass.states.async_entity_ids("sensor"):
-            if device_entity_id in entity_id and "uptime" in entity_id.lower():
-                monitor_entity = entity_id
-                monitor_type = "uptime"
-                _LOGGER.info("Found uptime sensor: %s", monitor_entity)
-                break
-        
-        # Fallback to health sensor
-        if not monitor_entity:
-            for entity_id in self.hass.states.async_entity_ids("binary_sensor"):
-                if device_entity_id in entity_id and "health" in entity_id.lower():
-                    monitor_entity = entity_id
-                    monitor_type = "health"
-                    _LOGGER.info("Found health sensor: %s", monitor_entity)
-                    break
+        # The restart call below is fired non-blocking, so service errors
+        # never surface here; refuse up front if the entity cannot take it
+        restart_state = self.hass.states.get(restart_entity)
+        if restart_state is None or restart_state.state == STATE_UNAVAILABLE:
+            return {
+                "status": "error",
+                "offline_detected": None,
+                "online_detected": None,
+                "error": f"Restart entity unavailable: {restart_entity}",
+            }
         
-        # Last fallback to wifi sensor
-        if not monitor_entity:
-            for entity_id in self.hass.states.async_entity_ids("sensor"):
-                if device_entity_id in entity_id and "wifi" in entity_id.lower():
-                    monitor_entity = entity_id
-                    monitor_type = "wifi"
-                    _LOGGER.info("Found wifi sensor: %s", monitor_entity)
-                    break
+        # STEP 2: Find monitoring sensor (uptime preferred, then health, then
+        # wifi) among the device's entities; shared with the Flash postcheck
+        monitor_entity, monitor_type = self._entity_index.select_monitor(
+            device_entity_id
+        )
         
-        if not monitor_entity:
+        if monitor_entity:
+            _LOGGER.info("Found %s sensor: %s", monitor_type, monitor_entity)
+        else:
             _LOGGER.warning("No monitoring sensor found (searched for uptime/health/wifi with '%s' in entity_id)", device_entity_id)
         
         # Record initial state for monitoring
@@ -809,7 +1141,7 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
         
         if monitor_entity:
             initial_state = self.hass.states.get(monitor_entity)
-            initial_available = initial_state.state not in ["unavailable", "unknown"] if initial_state else False
+            initial_available = initial_state.state not in _UNAVAILABLE if initial_state else False
             
             # If monitoring uptime, record initial value
             if monitor_type == "uptime" and initial_available:
@@ -821,128 +1153,157 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
             
             _LOGGER.debug("Initial state: %s (available=%s)", initial_state.state if initial_state else "None", initial_available)
         
-        # STEP 3: Call ESPHome restart (robust handling for momentary switches)
-        try:
-            if restart_domain == "button":
-                # Buttons: Simple press
-                await self.hass.services.async_call(
-                    "button",
-                    "press",
-                    {"entity_id": restart_entity},
-                    blocking=True,
-                )
-                _LOGGER.info("Restart button pressed: %s", restart_entity)
-            elif restart_domain == "switch":
-                # Switches: Often momentary (like buttons)
-                # Robust pattern: turn_on → wait → optional turn_off
-                await self.hass.services.async_call(
-                    "switch",
-                    "turn_on",
-                    {"entity_id": restart_entity},
-                    blocking=True,
-                )
-                _LOGGER.info("Restart switch activated (turn_on): %s", restart_entity)
-                
-                # Brief pause (allow restart trigger to register)
-                await asyncio.sleep(0.5)
-                
-                # Check if switch is still ON (may auto-reset to OFF)
-                switch_state = self.hass.states.get(restart_entity)
-                if switch_state and switch_state.state == "on":
-                    # Switch did not auto-reset → manually turn off
-                    await self.hass.services.async_call(
-                        "switch",
-                        "turn_off",
-                        {"entity_id": restart_entity},
-                        blocking=True,
-                    )
-                    _LOGGER.debug("Restart switch reset (turn_off): %s", restart_entity)
-                else:
-                    _LOGGER.debug("Restart switch auto-reset detected (momentary)")
-        except Exception as e:
-            _LOGGER.error("Restart activation failed: %s", e, exc_info=True)
-            return {
-                "status": "error",
-                "offline_detected": None,
-                "online_detected": None,
-                "error": f"Restart activation failed: {str(e)}",
-            }
-        
-        # STEP 4: Best-effort reboot detection (if monitoring available)
-        if not monitor_entity:
-            # No monitoring available - assume success after button press
-            _LOGGER.info("No monitoring sensor, assuming restart successful")
-            return {
-                "status": "success",
-                "offline_detected": "N/A (no monitoring)",
-                "online_detected": "N/A (no monitoring)",
-                "error": None,
-            }
-        
-        # Poll for offline→online sequence OR uptime reset (max 90 seconds)
+        # Reboot detection state, advanced by state_changed events of the
+        # monitor entity (no polling). Detection times are loop clock
+        # readings, formatted as ISO timestamps once detection ends.
         offline_detected = None
         online_detected = None
         uptime_reset_detected = None
         max_wait = 90  # seconds
-        poll_interval = 2  # seconds
-        elapsed = 0
+        start = self.hass.loop.time()
+        done = asyncio.Event()
         
-        _LOGGER.info("Polling for reboot detection (max %ds)...", max_wait)
+        # Last uptime string found not to be a reset (parsed once)
+        checked_uptime = initial_state.state if initial_uptime is not None else None
         
-        while elapsed < max_wait:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+        def _evaluate(current_state: State | None) -> None:
+            """Advance reboot detection with a monitor entity state."""
+            nonlocal offline_detected, online_detected, uptime_reset_detected, checked_uptime
+            if not current_state or done.is_set():
+                return
             
-            current_state = self.hass.states.get(monitor_entity)
-            if not current_state:
-                continue
-            
-            current_available = current_state.state not in ["unavailable", "unknown"]
+            now = self.hass.loop.time()
+            elapsed = int(now - start)
+            state_val = current_state.state
+            current_available = state_val not in _UNAVAILABLE
             
             # Method 1: Detect offline transition
             if not offline_detected and not current_available:
-                offline_detected = datetime.now(timezone.utc).isoformat()
-                _LOGGER.info("Device offline detected at %s (elapsed=%ds)", offline_detected, elapsed)
+                offline_detected = now
+                _LOGGER.info("Device offline detected (elapsed=%ds)", elapsed)
             
-            # Method 2: Detect uptime reset (device rebooted without going offline)
-            if monitor_type == "uptime" and current_available and initial_uptime is not None:
+            # Method 2: Detect uptime reset (device rebooted without going offline);
+            # initial_uptime is only set for uptime monitors with a numeric baseline
+            if initial_uptime is not None and current_available and state_val != checked_uptime:
                 try:
-                    current_uptime = float(current_state.state)
+                    current_uptime = float(state_val)
                     if current_uptime < initial_uptime:
-                        uptime_reset_detected = datetime.now(timezone.utc).isoformat()
+                        uptime_reset_detected = now
                         _LOGGER.info("Uptime reset detected: %.2fs → %.2fs (elapsed=%ds)", initial_uptime, current_uptime, elapsed)
-                        # SUCCESS: uptime reset indicates reboot
-                        return {
-                            "status": "success",
-                            "offline_detected": offline_detected or "N/A",
-                            "online_detected": uptime_reset_detected,
-                            "error": None,
-                        }
+                        done.set()
+                        return
+                    checked_uptime = state_val
                 except (ValueError, TypeError):
                     pass
             
             # Method 3: Detect online transition (after offline)
             if offline_detected and not online_detected and current_available:
-                online_detected = datetime.now(timezone.utc).isoformat()
-                _LOGGER.info("Device online detected at %s (elapsed=%ds)", online_detected, elapsed)
-                # SUCCESS: saw full offline→online sequence
+                online_detected = now
+                _LOGGER.info("Device online detected (elapsed=%ds)", elapsed)
+                done.set()
+        
+        @callback
+        def _monitor_changed(event: Event) -> None:
+            # Operate on the event's state objects directly (no states.get);
+            # attribute-only updates leave the detection outcome unchanged
+            new_state = event.data["new_state"]
+            old_state = event.data["old_state"]
+            if (
+                new_state is not None
+                and old_state is not None
+                and new_state.state == old_state.state
+            ):
+                return
+            _evaluate(new_state)
+        
+        # Subscribe before triggering the restart so the leading offline
+        # edge cannot slip past while the service call is in flight
+        unsub_state = (
+            async_track_state_change_event(self.hass, [monitor_entity], _monitor_changed)
+            if monitor_entity
+            else None
+        )
+        try:
+            # Device already offline before the press counts as offline edge;
+            # evaluated before the call so this pre-press snapshot can never
+            # override events handled while the restart is in flight
+            _evaluate(initial_state)
+            
+            # STEP 3: Call ESPHome restart (non-blocking; the device may drop
+            # off the network before the service handler returns, so only
+            # local dispatch errors can be caught here)
+            try:
+                if restart_domain == "button":
+                    # Buttons: Simple press
+                    await self.hass.services.async_call(
+                        "button",
+                        "press",
+                        {"entity_id": restart_entity},
+                        blocking=False,
+                    )
+                    _LOGGER.info("Restart button pressed: %s", restart_entity)
+                elif restart_domain == "switch":
+                    await self._async_activate_restart_switch(restart_entity)
+            except Exception as e:
+                _LOGGER.error("Restart activation failed: %s", e, exc_info=True)
+                return {
+                    "status": "error",
+                    "offline_detected": None,
+                    "online_detected": None,
+                    "error": f"Restart activation failed: {str(e)}",
+                }
+            
+            # STEP 4: Best-effort reboot detection (if monitoring available)
+            if not monitor_entity:
+                # No monitoring available - assume success after button press
+                _LOGGER.info("No monitoring sensor, assuming restart successful")
                 return {
                     "status": "success",
-                    "offline_detected": offline_detected,
-                    "online_detected": online_detected,
+                    "offline_detected": "N/A (no monitoring)",
+                    "online_detected": "N/A (no monitoring)",
                     "error": None,
                 }
+            
+            # Wait for offline→online sequence OR uptime reset (max 90 seconds)
+            _LOGGER.info("Waiting for reboot detection (max %ds)...", max_wait)
+            try:
+                await asyncio.wait_for(done.wait(), timeout=max_wait)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            if unsub_state is not None:
+                unsub_state()
+        
+        # Convert loop clock detection times to wall clock ISO timestamps
+        wall_now = datetime.now(timezone.utc)
+        loop_now = self.hass.loop.time()
+        offline_detected, online_detected, uptime_reset_detected = (
+            (wall_now - timedelta(seconds=loop_now - ts)).isoformat()
+            if ts is not None
+            else None
+            for ts in (offline_detected, online_detected, uptime_reset_detected)
+        )
         
-        # Timeout reached - determine result
+        # SUCCESS: uptime reset indicates reboot
         if uptime_reset_detected:
-            # Uptime reset seen but didn't return early
             return {
                 "status": "success",
                 "offline_detected": offline_detected or "N/A",
                 "online_detected": uptime_reset_detected,
                 "error": None,
             }
-        elif offline_detected and not online_detected:
+        
+        # SUCCESS: saw full offline→online sequence
+        if offline_detected and online_detected:
+            return {
+                "status": "success",
+                "offline_detected": offline_detected,
+                "online_detected": online_detected,
+                "error": None,
+            }
+        
+        # Timeout reached - determine result
+        if offline_detected and not online_detected:
             _LOGGER.warning("Restart timeout: offline detected but device not back online after %ds", max_wait)
             return {
                 "status": "warn",
@@ -967,6 +1328,66 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
                 "error": "Unexpected state in restart tracking",
             }
     
+    async def _async_activate_restart_switch(self, restart_entity: str) -> None:
+        """Trigger a restart switch, resetting it if it does not auto-reset.
+        
+        ESPHome restart switches are often momentary (like buttons): they
+        flip back to off on their own. Waits up to 1s for that transition
+        and only turns the switch off manually if it stays on.
+        
+        Args:
+            restart_entity: Restart switch entity_id
+        """
+        auto_reset = asyncio.Event()
+        
+        @callback
+        def _switch_changed(event: Event) -> None:
+            old_state = event.data["old_state"]
+            new_state = event.data["new_state"]
+            if (
+                old_state is not None
+                and new_state is not None
+                and old_state.state == STATE_ON
+                and new_state.state == STATE_OFF
+            ):
+                auto_reset.set()
+        
+        unsub = async_track_state_change_event(
+            self.hass, [restart_entity], _switch_changed
+        )
+        try:
+            await self.hass.services.async_call(
+                "switch",
+                "turn_on",
+                {"entity_id": restart_entity},
+                blocking=False,
+            )
+            _LOGGER.info("Restart switch activated (turn_on): %s", restart_entity)
+            
+            # Wake as soon as the switch resets itself (momentary switch)
+            try:
+                await asyncio.wait_for(auto_reset.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            unsub()
+        
+        if auto_reset.is_set():
+            _LOGGER.debug("Restart switch auto-reset detected (momentary)")
+            return
+        
+        # Check if switch is still ON (did not auto-reset)
+        switch_state = self.hass.states.get(restart_entity)
+        if switch_state and switch_state.state == STATE_ON:
+            # Switch did not auto-reset → manually turn off
+            await self.hass.services.async_call(
+                "switch",
+                "turn_off",
+                {"entity_id": restart_entity},
+                blocking=False,
+            )
+            _LOGGER.debug("Restart switch reset (turn_off): %s", restart_entity)
+    
     async def _find_restart_entity(self, device_entity_id: str) -> tuple[str | None, str | None]:
         """Find ESPHome restart entity (button or switch) for device.
         
@@ -980,68 +1401,159 @@ class PVAutonomyOpsRestartButton(ButtonEntity):
         Returns:
             Tuple of (entity_id, domain) or (None, None) if not found
         """
-        # A) Pattern-based search (most common naming conventions)
-        patterns = [
-            # Switches (ESPHome often uses switches for restart)
-            ("switch", f"switch.{device_entity_id}_restart"),
-            ("switch", f"switch.{device_entity_id}_restart_device"),
-            ("switch", f"switch.{device_entity_id}_reboot"),
-            ("switch", f"switch.{device_entity_id}_neustart"),  # German ESPHome default
-            ("switch", f"switch.{device_entity_id}_restart_esp"),
-            # Buttons (newer ESPHome versions)
-            ("button", f"button.{device_entity_id}_restart"),
-            ("button", f"button.{device_entity_id}_restart_device"),
-            ("button", f"button.{device_entity_id}_reboot"),
-        ]
+        # Memoized result from a previous press (valid while the entity exists)
+        cached = self._restart_entity_cache.get(device_entity_id)
+        if cached is not None:
+            if self.hass.states.get(cached[0]) is not None:
+                return cached
+            del self._restart_entity_cache[device_entity_id]
+        
+        result = self._discover_restart_entity(device_entity_id)
+        if result[0] is not None:
+            self._restart_entity_cache[device_entity_id] = result
+        return result
+    
+    def _discover_restart_entity(self, device_entity_id: str) -> tuple[str | None, str | None]:
+        """Search for the restart entity (uncached, see _find_restart_entity).
+        
+        Devices in the entity registry are resolved in one sweep over their
+        own switches/buttons; devices unknown to the registry fall back to
+        naming patterns plus a keyword scan of all switches/buttons.
+        
+        Args:
+            device_entity_id: Device identifier (e.g., "sph10k_haus_03")
+            
+        Returns:
+            Tuple of (entity_id, domain) or (None, None) if not found
+        """
+        entries = self._entity_index.device_entries(device_entity_id)
+        if entries is not None:
+            result = self._sweep_restart_entries(device_entity_id, entries)
+        else:
+            result = self._scan_restart_states(device_entity_id)
+        
+        if result[0] is None:
+            _LOGGER.error("Could not find restart entity for device: %s (tried switches/buttons with entity_id containing '%s_')", device_entity_id, device_entity_id)
+        return result
+    
+    def _sweep_restart_entries(
+        self, device_entity_id: str, entries: list[er.RegistryEntry]
+    ) -> tuple[str | None, str | None]:
+        """Find the restart entity in one pass over the device's registry entries.
+        
+        A naming-pattern match (see _RESTART_PATTERNS) wins immediately; the
+        first keyword match on entity_id or friendly_name is kept as fallback.
+        
+        Args:
+            device_entity_id: Device identifier (e.g., "sph10k_haus_03")
+            entries: Registry entries of the device
+            
+        Returns:
+            Tuple of (entity_id, domain) or (None, None) if not found
+        """
+        pattern = re.compile(
+            rf"(?:switch|button)\.{re.escape(device_entity_id)}_{_RESTART_SUFFIX_RE}"
+        )
+        states_get = self.hass.states.get
+        fallback: tuple[str | None, str | None] = (None, None)
+        
+        for entry in entries:
+            domain = entry.domain
+            if domain != "switch" and domain != "button":
+                continue
+            entity_id = entry.entity_id
+            state = states_get(entity_id)
+            if not state:
+                continue
+            
+            if pattern.fullmatch(entity_id):
+                _LOGGER.info("Found restart %s via pattern: %s", domain, entity_id)
+                return entity_id, domain
+            
+            if fallback[0] is not None:
+                continue
+            
+            # Check entity_id for restart keywords (already lowercase)
+            if _RESTART_RE.search(entity_id):
+                _LOGGER.debug("Restart %s candidate via entity_id: %s", domain, entity_id)
+                fallback = (entity_id, domain)
+                continue
+            
+            # Check friendly_name for restart keywords
+            friendly_name = state.attributes.get("friendly_name", "").lower()
+            if _RESTART_RE.search(friendly_name):
+                _LOGGER.debug("Restart %s candidate via friendly_name: %s (%s)", domain, entity_id, friendly_name)
+                fallback = (entity_id, domain)
+        
+        if fallback[0] is not None:
+            _LOGGER.info("Found restart %s via keyword: %s", fallback[1], fallback[0])
+        return fallback
+    
+    def _scan_restart_states(self, device_entity_id: str) -> tuple[str | None, str | None]:
+        """Find the restart entity of a device unknown to the entity registry.
         
-        for domain, entity_id in patterns:
-            if self.hass.states.get(entity_id):
+        Args:
+            device_entity_id: Device identifier (e.g., "sph10k_haus_03")
+            
+        Returns:
+            Tuple of (entity_id, domain) or (None, None) if not found
+        """
+        # A) Pattern-based search (most common naming conventions)
+        states_get = self.hass.states.get
+        for domain, suffix in _RESTART_PATTERNS:
+            entity_id = f"{domain}.{device_entity_id}{suffix}"
+            if states_get(entity_id):
                 _LOGGER.info("Found restart %s via pattern: %s", domain, entity_id)
                 return entity_id, domain
         
-        # B) Friendly-Name Fallback: Iterate over all switches/buttons
+        # B) Friendly-Name Fallback: state scan of all switches/buttons
         _LOGGER.debug("Pattern match failed, searching via friendly_name...")
         
-        restart_keywords = ["restart", "neustart", "reboot"]
-        
-        for domain in ["switch", "button"]:
+        # Filter: entity_id must contain device identifier
+        marker = f"{device_entity_id}_"
+        for domain in ("switch", "button"):
             for entity_id in self.hass.states.async_entity_ids(domain):
-                # Filter: entity_id must contain device identifier
-                if f"{device_entity_id}_" not in entity_id:
+                if marker not in entity_id:
                     continue
                 
-                state = self.hass.states.get(entity_id)
+                state = states_get(entity_id)
                 if not state:
                     continue
                 
-                # Check entity_id for restart keywords
-                entity_lower = entity_id.lower()
-                if any(keyword in entity_lower for keyword in restart_keywords):
+                # Check entity_id for restart keywords (already lowercase)
+                if _RESTART_RE.search(entity_id):
                     _LOGGER.info("Found restart %s via entity_id: %s", domain, entity_id)
                     return entity_id, domain
                 
                 # Check friendly_name for restart keywords
                 friendly_name = state.attributes.get("friendly_name", "").lower()
-                if any(keyword in friendly_name for keyword in restart_keywords):
+                if _RESTART_RE.search(friendly_name):
                     _LOGGER.info("Found restart %s via friendly_name: %s (%s)", domain, entity_id, friendly_name)
                     return entity_id, domain
         
-        _LOGGER.error("Could not find restart entity for device: %s (tried switches/buttons with entity_id containing '%s_')", device_entity_id, device_entity_id)
         return None, None
 
 
 class PVAutonomyOpsRunGatesButton(ButtonEntity):
     """Output K: button.pvautonomy_ops_run_gates (Action K: Run Quality Gates)."""
 
+    # Integration-owned members only (see PVAutonomyOpsRestartButton)
+    __slots__ = ("operation_runner", "input_reader", "_domain_data", "_gate_checker")
+
     _attr_name = "PVAutonomy Ops Run Gates"
     _attr_unique_id = ENTITY_BUTTON_GATES
     _attr_suggested_object_id = ENTITY_BUTTON_GATES
     _attr_icon = "mdi:gate"
+    _attr_should_poll = False
 
     def __init__(self, hass, operation_runner, input_reader):
         self.hass = hass
         self.operation_runner = operation_runner
         self.input_reader = input_reader
+        # Entry-scoped shared objects (same dict for the entry's lifetime)
+        self._domain_data: dict[str, Any] = hass.data[DOMAIN]
+        # Stateless checker, reused across presses
+        self._gate_checker = QualityGateChecker(hass, input_reader)
         self._attr_extra_state_attributes = {
             "target_device": None,
             "last_result": None,
@@ -1058,6 +1570,7 @@ class PVAutonomyOpsRunGatesButton(ButtonEntity):
         """Execute gate validation (Contract Action K)."""
         _LOGGER.info("Run Gates button pressed")
         start_time = datetime.now(timezone.utc)
+        t_start = time.monotonic()
 
         # Get selected device (legacy input_select, optional filtering)
         selected_device = await self.input_reader.get_selected_device()
@@ -1074,44 +1587,42 @@ class PVAutonomyOpsRunGatesButton(ButtonEntity):
             if result["success"] and result.get("result"):
                 gate_results = result["result"]
                 
+                summary = {key: gate_results.get(key) for key in _GATE_SUMMARY_KEYS}
+                
                 # Update attributes from gate results
                 self._attr_extra_state_attributes.update(
-                    {
-                        "target_device": selected_device,
-                        "last_result": gate_results.get("last_result"),
-                        "gates_total": gate_results.get("gates_total"),
-                        "gates_passed": gate_results.get("gates_passed"),
-                        "gates_failed": gate_results.get("gates_failed"),
-                        "gates_warned": gate_results.get("gates_warned"),
-                        "failed_gates": gate_results.get("failed_gates"),
-                        "warned_gates": gate_results.get("warned_gates"),
-                        "duration_ms": result["duration_ms"],
-                    }
+                    summary,
+                    target_device=selected_device,
+                    duration_ms=result["duration_ms"],
                 )
 
-                # Trigger sensor update with gate results
-                self.hass.bus.async_fire(
-                    f"{DOMAIN}_gates_completed",
-                    {
-                        "overall": gate_results.get("last_result"),
-                        "gates_total": gate_results.get("gates_total"),
-                        "gates_passed": gate_results.get("gates_passed"),
-                        "gates_failed": gate_results.get("gates_failed"),
-                        "gates_warned": gate_results.get("gates_warned"),
-                        "failed_gates": gate_results.get("failed_gates"),
-                        "warned_gates": gate_results.get("warned_gates"),
-                        "details": gate_results.get("details"),
-                        "checked_at": start_time.isoformat(),
-                    },
+                # Trigger sensor update with gate results (same summary, with
+                # last_result published as "overall")
+                payload = dict(summary)
+                payload["overall"] = payload.pop("last_result")
+                payload["details"] = gate_results.get("details")
+                payload["checked_at"] = start_time.isoformat()
+                self.hass.bus.async_fire(f"{DOMAIN}_gates_completed", payload)
+
+                # Typed copy of the same verdict for the flash guards
+                domain_data = self._domain_data
+                last_run_ts = start_time.timestamp()
+                domain_data["gates"] = GatesSnapshot(
+                    overall=summary["last_result"],
+                    last_run_ts=last_run_ts,
+                    fresh_until_ts=last_run_ts
+                    + domain_data["guard_config"].freshness_timeout.total_seconds(),
+                    fail=tuple(summary["failed_gates"] or ()),
+                    warn=tuple(summary["warned_gates"] or ()),
                 )
 
                 _LOGGER.info(
                     "Quality gates completed: %s (total=%d, passed=%d, warned=%d, failed=%d)",
-                    gate_results.get("last_result"),
-                    gate_results.get("gates_total"),
-                    gate_results.get("gates_passed"),
-                    gate_results.get("gates_warned"),
-                    gate_results.get("gates_failed"),
+                    summary["last_result"],
+                    summary["gates_total"],
+                    summary["gates_passed"],
+                    summary["gates_warned"],
+                    summary["gates_failed"],
                 )
             else:
                 # Operation failed - log error
@@ -1135,9 +1646,7 @@ class PVAutonomyOpsRunGatesButton(ButtonEntity):
                     "gates_warned": 0,
                     "failed_gates": [],
                     "warned_gates": [],
-                    "duration_ms": int(
-                        (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
-                    ),
+                    "duration_ms": int((time.monotonic() - t_start) * 1000),
                 }
             )
             
@@ -1153,21 +1662,14 @@ class PVAutonomyOpsRunGatesButton(ButtonEntity):
         Returns:
             Dictionary with gate results
         """
-        from .gates import QualityGateChecker
-
-        start_time = datetime.now(timezone.utc)
+        t_start = time.monotonic()
         target_device = operation_data.get("target_device")
 
-        # Initialize gate checker
-        gate_checker = QualityGateChecker(self.hass, self.input_reader)
-
         # Run all gates
-        summary = await gate_checker.run_all_gates(target_device)
+        summary = await self._gate_checker.run_all_gates(target_device)
 
         # Calculate duration
-        duration_ms = int(
-            (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
-        )
+        duration_ms = int((time.monotonic() - t_start) * 1000)
 
         # Map overall status to last_result (pass|warn|fail)
         overall = summary["overall"]
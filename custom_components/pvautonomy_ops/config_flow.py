@@ -43,6 +43,31 @@ CONF_FLASH_MIN_SIZE_KB = "flash_min_firmware_size_kb"
 CONF_GATES_FRESHNESS_MIN = "gates_freshness_minutes"
 CONF_STRICT_GATES = "strict_gates_required"
 
+# Options form fields: (key, default, validator), built once at import;
+# only the per-call defaults (current option values) are bound on open
+_OPTIONS_FIELDS: tuple[tuple[str, Any, Any], ...] = (
+    (
+        CONF_POLL_INTERVAL,
+        DEFAULT_POLL_INTERVAL,
+        vol.All(int, vol.Range(min=10, max=300)),
+    ),
+    (CONF_ARTIFACT_CHANNEL, DEFAULT_ARTIFACT_CHANNEL, vol.In(["stable", "beta"])),
+    (CONF_ARTIFACT_HW_FAMILY, DEFAULT_ARTIFACT_HW_FAMILY, str),
+    (CONF_ARTIFACT_OWNER, DEFAULT_ARTIFACT_OWNER, str),
+    (CONF_ARTIFACT_REPO, DEFAULT_ARTIFACT_REPO, str),
+    (
+        CONF_FLASH_MIN_SIZE_KB,
+        DEFAULT_FLASH_MIN_SIZE_KB,
+        vol.All(int, vol.Range(min=50, max=5000)),
+    ),
+    (
+        CONF_GATES_FRESHNESS_MIN,
+        DEFAULT_GATES_FRESHNESS_MIN,
+        vol.All(int, vol.Range(min=1, max=60)),
+    ),
+    (CONF_STRICT_GATES, DEFAULT_STRICT_GATES, bool),
+)
+
 
 class PVAutonomyOpsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for PVAutonomy Ops."""
@@ -132,54 +157,8 @@ class PVAutonomyOpsOptionsFlow(config_entries.OptionsFlow):
             step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(
-                        CONF_POLL_INTERVAL,
-                        default=options.get(
-                            CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
-                        ),
-                    ): vol.All(int, vol.Range(min=10, max=300)),
-                    vol.Optional(
-                        CONF_ARTIFACT_CHANNEL,
-                        default=options.get(
-                            CONF_ARTIFACT_CHANNEL, DEFAULT_ARTIFACT_CHANNEL
-                        ),
-                    ): vol.In(["stable", "beta"]),
-                    vol.Optional(
-                        CONF_ARTIFACT_HW_FAMILY,
-                        default=options.get(
-                            CONF_ARTIFACT_HW_FAMILY, DEFAULT_ARTIFACT_HW_FAMILY
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_ARTIFACT_OWNER,
-                        default=options.get(
-                            CONF_ARTIFACT_OWNER, DEFAULT_ARTIFACT_OWNER
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_ARTIFACT_REPO,
-                        default=options.get(
-                            CONF_ARTIFACT_REPO, DEFAULT_ARTIFACT_REPO
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_FLASH_MIN_SIZE_KB,
-                        default=options.get(
-                            CONF_FLASH_MIN_SIZE_KB, DEFAULT_FLASH_MIN_SIZE_KB
-                        ),
-                    ): vol.All(int, vol.Range(min=50, max=5000)),
-                    vol.Optional(
-                        CONF_GATES_FRESHNESS_MIN,
-                        default=options.get(
-                            CONF_GATES_FRESHNESS_MIN, DEFAULT_GATES_FRESHNESS_MIN
-                        ),
-                    ): vol.All(int, vol.Range(min=1, max=60)),
-                    vol.Optional(
-                        CONF_STRICT_GATES,
-                        default=options.get(
-                            CONF_STRICT_GATES, DEFAULT_STRICT_GATES
-                        ),
-                    ): bool,
+                    vol.Optional(key, default=options.get(key, default)): validator
+                    for key, default, validator in _OPTIONS_FIELDS
                 }
             ),
         )
@@ -12,6 +12,9 @@ CONTRACT_VERSION = "v1.0.0"
 # Update interval (seconds)
 UPDATE_INTERVAL = 60
 
+# Update interval while an operation is running (seconds)
+ACTIVE_UPDATE_INTERVAL = 2
+
 # ============================================================================
 # Contract Inputs (READ) - Source: ops-contract-v1.md Section 1
 # ============================================================================
@@ -66,6 +69,17 @@ STATE_ERROR = "error"
 STATE_DEGRADED = "degraded"
 STATE_INITIALIZING = "initializing"
 
+# ============================================================================
+# Flash Guard Block Reasons (D-ADDON-FLASH-GUARD-001)
+# Machine-readable values of the Flash button's block_reason attribute
+# ============================================================================
+BLOCK_GATES_MISSING = "gates_missing"
+BLOCK_GATES_STALE = "gates_stale"
+BLOCK_GATES_FAILED = "gates_failed"
+BLOCK_GATES_WARNED = "gates_warned"
+BLOCK_INVALID_TIMESTAMP = "invalid_timestamp"
+BLOCK_OP_BUSY = "op_busy"
+
 # ============================================================================
 # Known Metrics (for validation - optional)
 # ============================================================================
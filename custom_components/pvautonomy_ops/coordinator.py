@@ -0,0 +1,85 @@
+"""Data Update Coordinator for PVAutonomy Ops.
+
+Reads Contract Inputs A-F once per poll interval and feeds all
+sensors from a single snapshot (no per-sensor re-reads).
+
+Polling is adaptive: ACTIVE_UPDATE_INTERVAL while an operation is
+running, the Options Flow poll interval while idle.
+"""
+import logging
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import ACTIVE_UPDATE_INTERVAL, DOMAIN
+from .discovery import ContractInputReader
+from .operations import OperationTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PVAutonomyOpsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinate Contract Input reads for all PVAutonomy Ops sensors."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        input_reader: ContractInputReader,
+        operation_tracker: OperationTracker,
+        poll_interval: int,
+    ) -> None:
+        """Initialize coordinator.
+
+        Args:
+            hass: Home Assistant instance
+            input_reader: Contract input reader
+            operation_tracker: Operation tracker (drives adaptive interval)
+            poll_interval: Idle update interval in seconds (Options Flow)
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=poll_interval),
+        )
+        self.input_reader = input_reader
+        self.operation_tracker = operation_tracker
+        self._idle_interval = timedelta(seconds=poll_interval)
+        self._active_interval = timedelta(seconds=ACTIVE_UPDATE_INTERVAL)
+
+    async def async_set_poll_interval(self, poll_interval: int) -> None:
+        """Apply a new idle poll interval without reloading the entry.
+
+        Args:
+            poll_interval: Idle update interval in seconds (Options Flow)
+        """
+        self._idle_interval = timedelta(seconds=poll_interval)
+        # Refresh now so the next tick is scheduled with the new interval
+        await self.async_request_refresh()
+
+    async def async_operation_started(self, _event: Event) -> None:
+        """Refresh now so the next tick is scheduled at the active interval."""
+        await self.async_request_refresh()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Read all Contract Inputs in one pass.
+
+        Returns:
+            Snapshot dict from ContractInputReader.read_all()
+        """
+        # Next tick: tight while an operation runs, relaxed when idle
+        self.update_interval = (
+            self._active_interval
+            if self.operation_tracker.is_running
+            else self._idle_interval
+        )
+
+        try:
+            return await self.input_reader.read_all()
+        except Exception as err:
+            raise UpdateFailed(f"Error reading contract inputs: {err}") from err
@@ -7,11 +7,22 @@ P3-8-001: Added Device Registry discovery for Factory + Production devices.
 Directive: D-OPS-FACTORY-DISCOVERY-001
 """
 import logging
-import time
-from typing import Any
-
-from homeassistant.core import HomeAssistant
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     ENTITY_CONTROL_NUMBER_PATTERN,
@@ -33,6 +44,69 @@ MODEL_PRODUCTION = "Edge101"
 DEVICE_KIND_FACTORY = "factory"
 DEVICE_KIND_PRODUCTION = "production"
 
+# Input B selector states that mean "no device selected"
+NO_SELECTION = frozenset(("none", STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# Domains of the per-device runtime/control entities (Inputs D+E)
+METRIC_DOMAINS = ("sensor", "number", "switch")
+
+
+@dataclass(slots=True, frozen=True)
+class RegistryDevice:
+    """PVAutonomy device found in the HA Device Registry (immutable)."""
+
+    id: str
+    name: str
+    kind: str  # DEVICE_KIND_FACTORY | DEVICE_KIND_PRODUCTION
+    model: str
+    sw_version: str
+    mac: str | None
+    identifiers: tuple[tuple[str, str], ...]
+
+
+class SensorMetric(NamedTuple):
+    """Input D runtime sensor reading."""
+
+    entity_id: str
+    state: str
+    unit: str | None
+    device_class: str | None
+
+
+class NumberMetric(NamedTuple):
+    """Input E number control reading."""
+
+    entity_id: str
+    state: str
+    min: float | None
+    max: float | None
+    step: float | None
+
+
+class SwitchMetric(NamedTuple):
+    """Input E switch control reading."""
+
+    entity_id: str
+    state: str
+
+
+@lru_cache(maxsize=512)
+def _health_entity_id(device: str) -> str:
+    """Input C entity_id of a device (ENTITY_HEALTH_PATTERN, formatted once)."""
+    return ENTITY_HEALTH_PATTERN.format(device=device)
+
+
+@lru_cache(maxsize=512)
+def _hardware_family_entity_id(device: str) -> str:
+    """Input F entity_id of a device (ENTITY_HARDWARE_FAMILY_PATTERN, formatted once)."""
+    return ENTITY_HARDWARE_FAMILY_PATTERN.format(device=device)
+
+
+@callback
+def _entity_added_or_removed(event_data: EventStateChangedData) -> bool:
+    """Filter state_changed events down to entities appearing/disappearing."""
+    return event_data["old_state"] is None or event_data["new_state"] is None
+
 
 class ContractInputReader:
     """Read Contract Inputs from Home Assistant."""
@@ -45,23 +119,145 @@ class ContractInputReader:
         """
         self.hass = hass
         self.state_reader = HomeAssistantStateReader(hass)
-        # Cache for Device Registry scan (avoids duplicate scans per update cycle)
-        self._registry_cache: dict[str, list[dict[str, Any]]] | None = None
-        self._registry_cache_time: float = 0.0
-        self._registry_cache_ttl: float = 10.0  # seconds
+        # Fixed Contract Input entities (A, B), resolved once for read_all()
+        self._input_keys: tuple[tuple[str, str], ...] = (
+            ("discovery", ENTITY_DISCOVERY_SENSOR),
+            ("selector", ENTITY_DEVICE_SELECTOR),
+        )
+        # Device Registry (singleton per hass), resolved on first use
+        self._device_registry: dr.DeviceRegistry | None = None
+        # Device Registry scan result, kept until the registry changes
+        # (cleared by _handle_device_registry_updated)
+        self._registry_cache: dict[str, list[RegistryDevice]] | None = None
+        # Per-device records keyed by device id with the registry entry's
+        # modified_at; unchanged devices reuse their record on rescans
+        self._device_records: dict[str, tuple[datetime, RegistryDevice]] = {}
+        # Factory device names of the cached scan (O(1) kind lookup)
+        self._factory_names: frozenset[str] = frozenset()
+        # PVAutonomy device ids in the Device Registry (manufacturer index,
+        # insertion-ordered like the registry), built on first scan and then
+        # maintained from device registry events
+        self._pva_device_ids: dict[str, None] | None = None
+        # Last dropdown list handed out (returned again while unchanged)
+        self._dropdown_items: list[dict[str, str]] | None = None
+        # Input A device list, kept until the discovery sensor changes
+        self._discovered_cache: list[str] | None = None
+        # Inputs D+E entity index: device -> [(domain, key, entity_id)],
+        # built on first lookup and dropped when entities come or go
+        self._metric_index: dict[str, list[tuple[str, str, str]]] = {}
+        # "*_device" entity_ids per metric domain, shared by all devices'
+        # index builds (suffix filtered once, dropped with the index)
+        self._suffixed_ids: dict[str, list[str]] | None = None
         # Track previous counts for change-only logging
         self._prev_factory_count: int = -1
         self._prev_production_count: int = -1
 
+    @callback
+    def async_start_listeners(self) -> CALLBACK_TYPE:
+        """Subscribe to the events that invalidate the reader's indexes.
+        
+        Returns:
+            Callback that removes the listeners (for entry.async_on_unload)
+        """
+        unsubs = [
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._handle_entity_added_or_removed,
+                event_filter=_entity_added_or_removed,
+            ),
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._handle_device_registry_updated,
+            ),
+            async_track_state_change_event(
+                self.hass,
+                [ENTITY_DISCOVERY_SENSOR],
+                self._handle_discovery_changed,
+            ),
+        ]
+
+        @callback
+        def _remove_listeners() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _remove_listeners
+
+    @callback
+    def _handle_entity_added_or_removed(self, _event: Event[EventStateChangedData]) -> None:
+        """Drop the Inputs D+E index (an entity appeared or disappeared)."""
+        self._metric_index.clear()
+        self._suffixed_ids = None
+
+    @callback
+    def _handle_discovery_changed(self, _event: Event[EventStateChangedData]) -> None:
+        """Drop the cached Input A device list (discovery sensor changed)."""
+        self._discovered_cache = None
+
+    @callback
+    def _handle_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Keep the manufacturer index current and drop the scan cache."""
+        self._registry_cache = None
+        if self._pva_device_ids is None:
+            return
+
+        device_id = event.data["device_id"]
+        if event.data["action"] == "remove":
+            self._pva_device_ids.pop(device_id, None)
+            self._device_records.pop(device_id, None)
+            return
+
+        # create/update: manufacturer may have been set or changed
+        device_entry = self._get_device_registry().async_get(device_id)
+        if device_entry is not None and device_entry.manufacturer == MANUFACTURER_PVAUTONOMY:
+            self._pva_device_ids.setdefault(device_id, None)
+        else:
+            self._pva_device_ids.pop(device_id, None)
+
+    @callback
+    def _get_device_registry(self) -> dr.DeviceRegistry:
+        """Return the Device Registry, looked up once per reader."""
+        if self._device_registry is None:
+            self._device_registry = dr.async_get(self.hass)
+        return self._device_registry
+
     async def get_discovered_devices(self) -> list[str]:
         """Read Input A: sensor.edge101_production_devices.devices[]
         
         Returns:
             List of device names (empty if not found)
         """
-        devices = await self.state_reader.get_attribute(
-            ENTITY_DISCOVERY_SENSOR, "devices", default=[]
-        )
+        if self._discovered_cache is not None:
+            return self._discovered_cache
+        state = await self.state_reader.get_state(ENTITY_DISCOVERY_SENSOR)
+        return self._discovered_from_state(state)
+
+    def _discovered_from_state(self, state: State | None) -> list[str]:
+        """Return the cached Input A device list, filling it from state.
+        
+        Args:
+            state: Current state of ENTITY_DISCOVERY_SENSOR (or None)
+            
+        Returns:
+            List of device names (empty if not found)
+        """
+        if self._discovered_cache is None:
+            self._discovered_cache = self._devices_from_state(state)
+        return self._discovered_cache
+
+    @staticmethod
+    def _devices_from_state(state: State | None) -> list[str]:
+        """Extract Input A device list from the discovery sensor state.
+        
+        Args:
+            state: State of ENTITY_DISCOVERY_SENSOR (or None if missing)
+            
+        Returns:
+            List of device names (empty if not found)
+        """
+        devices = state.attributes.get("devices", []) if state is not None else []
         
         if not devices:
             _LOGGER.warning(
@@ -77,71 +273,53 @@ class ContractInputReader:
     # D-OPS-FACTORY-DISCOVERY-001: Factory + Production via HA Device Registry
     # ================================================================
 
-    async def get_registry_devices(self) -> dict[str, list[dict[str, Any]]]:
+    async def get_registry_devices(self) -> dict[str, list[RegistryDevice]]:
         """Scan HA Device Registry for PVAutonomy Edge101 devices.
         
-        Uses a short-lived cache (10s TTL) to avoid duplicate scans
-        when multiple sensors call this in the same update cycle.
+        The result is cached until the Device Registry reports a change,
+        so repeated calls (sensors, buttons, coordinator) never rescan
+        an unchanged registry.
         
         Identifies Factory vs Production devices by model field:
         - Edge101Factory → factory
         - Edge101 → production
         
         Returns:
-            Dict with 'factory' and 'production' device lists.
-            Each device is a dict: {id, name, kind, model, sw_version, mac, identifiers}
+            Dict with 'factory' and 'production' lists of RegistryDevice
+            records (shared, read-only).
         """
-        # Return cached result if fresh enough
-        now = time.monotonic()
-        if self._registry_cache is not None and (now - self._registry_cache_time) < self._registry_cache_ttl:
+        # Return cached result unless the registry changed since
+        if self._registry_cache is not None:
             return self._registry_cache
 
-        registry = dr.async_get(self.hass)
-        factory_devices: list[dict[str, Any]] = []
-        production_devices: list[dict[str, Any]] = []
-
-        for device_entry in registry.devices.values():
-            # Check manufacturer
-            if device_entry.manufacturer != MANUFACTURER_PVAUTONOMY:
-                continue
+        registry = self._get_device_registry()
+        factory_devices: list[RegistryDevice] = []
+        production_devices: list[RegistryDevice] = []
 
-            model = device_entry.model or ""
-            kind = None
+        # Manufacturer index: full registry pass only on the first scan
+        if self._pva_device_ids is None:
+            self._pva_device_ids = {
+                device_entry.id: None
+                for device_entry in registry.devices.values()
+                if device_entry.manufacturer == MANUFACTURER_PVAUTONOMY
+            }
 
-            if model == MODEL_FACTORY:
-                kind = DEVICE_KIND_FACTORY
-            elif model == MODEL_PRODUCTION:
-                kind = DEVICE_KIND_PRODUCTION
-            else:
-                # Unknown PVAutonomy model — skip
-                _LOGGER.debug(
-                    "Skipping PVAutonomy device with unknown model: %s (name=%s)",
-                    model,
-                    device_entry.name,
-                )
+        for device_id in self._pva_device_ids:
+            device_entry = registry.async_get(device_id)
+            if device_entry is None:
                 continue
 
-            # Extract MAC from connections if available
-            mac = None
-            for conn_type, conn_id in device_entry.connections:
-                if conn_type == dr.CONNECTION_NETWORK_MAC:
-                    mac = conn_id
-                    break
-
-            # Build device info dict
-            device_info = {
-                "id": device_entry.id,
-                "name": device_entry.name or "",
-                "kind": kind,
-                "model": model,
-                "sw_version": device_entry.sw_version or "",
-                "mac": mac,
-                "identifiers": [
-                    list(ident) for ident in device_entry.identifiers
-                ],
-            }
+            # Reuse the record while the registry entry is unmodified
+            cached = self._device_records.get(device_id)
+            if cached is not None and cached[0] == device_entry.modified_at:
+                device_info = cached[1]
+            else:
+                device_info = self._build_registry_device(device_entry)
+                if device_info is None:
+                    continue
+                self._device_records[device_id] = (device_entry.modified_at, device_info)
 
-            if kind == DEVICE_KIND_FACTORY:
+            if device_info.kind == DEVICE_KIND_FACTORY:
                 factory_devices.append(device_info)
             else:
                 production_devices.append(device_info)
@@ -168,55 +346,124 @@ class ContractInputReader:
         }
         # Store in cache
         self._registry_cache = result
-        self._registry_cache_time = now
+        self._factory_names = frozenset(dev.name for dev in factory_devices)
         return result
 
-    async def get_all_devices_for_dropdown(self) -> list[dict[str, str]]:
+    @staticmethod
+    def _build_registry_device(device_entry: dr.DeviceEntry) -> RegistryDevice | None:
+        """Build the record for a PVAutonomy registry device.
+        
+        Identifies Factory vs Production devices by model field.
+        
+        Args:
+            device_entry: Device Registry entry (manufacturer PVAutonomy)
+            
+        Returns:
+            RegistryDevice, or None for unknown PVAutonomy models
+        """
+        model = device_entry.model or ""
+
+        if model == MODEL_FACTORY:
+            kind = DEVICE_KIND_FACTORY
+        elif model == MODEL_PRODUCTION:
+            kind = DEVICE_KIND_PRODUCTION
+        else:
+            # Unknown PVAutonomy model — skip
+            _LOGGER.debug(
+                "Skipping PVAutonomy device with unknown model: %s (name=%s)",
+                model,
+                device_entry.name,
+            )
+            return None
+
+        # Extract MAC from connections if available
+        mac = next(
+            (
+                conn_id
+                for conn_type, conn_id in device_entry.connections
+                if conn_type == dr.CONNECTION_NETWORK_MAC
+            ),
+            None,
+        )
+
+        return RegistryDevice(
+            id=device_entry.id,
+            name=device_entry.name or "",
+            kind=kind,
+            model=model,
+            sw_version=device_entry.sw_version or "",
+            mac=mac,
+            identifiers=tuple(device_entry.identifiers),
+        )
+
+    async def get_all_devices_for_dropdown(
+        self,
+        registry_devices: dict[str, list[RegistryDevice]] | None = None,
+        legacy_devices: list[str] | None = None,
+    ) -> list[dict[str, str]]:
         """Get unified device list for dropdown population.
         
         Merges Device Registry (Factory + Production) into a single list
         suitable for input_select options.
         
+        Args:
+            registry_devices: get_registry_devices() result if the caller
+                already has it (read here otherwise)
+            legacy_devices: get_discovered_devices() result if the caller
+                already has it (read here otherwise)
+        
         Returns:
-            List of dicts: {value, label, kind}
+            List of dicts: {value, label, kind}; the same list object as the
+            previous call when the composition is unchanged
             - value: the option value for input_select
             - label: human-readable display label
             - kind: 'factory' or 'production'
         """
-        registry_devices = await self.get_registry_devices()
-        dropdown_items: list[dict[str, str]] = []
+        # Both sources up front: each is read at most once per call
+        if registry_devices is None:
+            registry_devices = await self.get_registry_devices()
+        if legacy_devices is None:
+            legacy_devices = await self.get_discovered_devices()
+
+        # Deduplicate on insert: factory (registry) devices go first, so a
+        # device that also appears in the legacy list keeps its registry entry
+        seen_values: set[str] = set()
+        unique_items: list[dict[str, str]] = []
 
         # Add factory devices
         for dev in registry_devices["factory"]:
-            name = dev["name"]
-            dropdown_items.append({
+            name = dev.name
+            if name in seen_values:
+                continue
+            seen_values.add(name)
+            unique_items.append({
                 "value": name,
                 "label": f"{name} (factory)",
                 "kind": DEVICE_KIND_FACTORY,
             })
 
         # Add production devices (from legacy template sensor for compatibility)
-        legacy_devices = await self.get_discovered_devices()
         for dev_name in legacy_devices:
-            dropdown_items.append({
+            if dev_name in seen_values:
+                continue
+            seen_values.add(dev_name)
+            unique_items.append({
                 "value": dev_name,
                 "label": f"{dev_name} (production)",
                 "kind": DEVICE_KIND_PRODUCTION,
             })
 
-        # Deduplicate: if a device appears in both registry and legacy, keep registry
-        seen_values = set()
-        unique_items: list[dict[str, str]] = []
-        for item in dropdown_items:
-            if item["value"] not in seen_values:
-                seen_values.add(item["value"])
-                unique_items.append(item)
+        # Unchanged composition: hand back the previous list object so
+        # callers can skip rewriting the dropdown with an identity check
+        if unique_items == self._dropdown_items:
+            return self._dropdown_items
 
         _LOGGER.debug(
             "Dropdown items: %d total (%s)",
             len(unique_items),
             [i["value"] for i in unique_items],
         )
+        self._dropdown_items = unique_items
         return unique_items
 
     async def get_selected_device_kind(self) -> str | None:
@@ -229,15 +476,32 @@ class ContractInputReader:
         if selected is None:
             return None
 
-        registry_devices = await self.get_registry_devices()
+        # Refresh the registry scan (and its factory name index) first
+        await self.get_registry_devices()
+        production = await self.get_discovered_devices()
+        return self._device_kind(selected, production)
+
+    def _device_kind(self, selected: str | None, production: list[str]) -> str | None:
+        """Classify a selected device as factory or production.
+        
+        Call after get_registry_devices() so the factory name index is
+        current.
+        
+        Args:
+            selected: Selected device name (or None)
+            production: Input A device list (legacy production devices)
+            
+        Returns:
+            'factory', 'production', or None
+        """
+        if selected is None:
+            return None
 
         # Check factory devices
-        for dev in registry_devices["factory"]:
-            if dev["name"] == selected:
-                return DEVICE_KIND_FACTORY
+        if selected in self._factory_names:
+            return DEVICE_KIND_FACTORY
 
         # Check production (legacy)
-        production = await self.get_discovered_devices()
         if selected in production:
             return DEVICE_KIND_PRODUCTION
 
@@ -249,14 +513,26 @@ class ContractInputReader:
         Returns:
             Selected device name or None if not selected or 'none'
         """
-        selected = await self.state_reader.get_state_value(
-            ENTITY_DEVICE_SELECTOR, default="none"
-        )
+        state = await self.state_reader.get_state(ENTITY_DEVICE_SELECTOR)
+        return self._selected_from_state(state)
+
+    @staticmethod
+    def _selected_from_state(state: State | None) -> str | None:
+        """Extract Input B selection from the device selector state.
         
-        if selected == "none" or selected is None:
-            _LOGGER.debug("No device selected (state=%s)", selected)
+        Args:
+            state: State of ENTITY_DEVICE_SELECTOR (or None if missing)
+            
+        Returns:
+            Selected device name or None if not selected or 'none'
+        """
+        if state is None or state.state in NO_SELECTION:
+            _LOGGER.debug(
+                "No device selected (state=%s)", state.state if state else None
+            )
             return None
         
+        selected = state.state
         _LOGGER.debug("Selected device: %s", selected)
         return selected
 
@@ -276,7 +552,7 @@ class ContractInputReader:
                 'available': bool  # False if entity missing
             }
         """
-        entity_id = ENTITY_HEALTH_PATTERN.format(device=device)
+        entity_id = _health_entity_id(device)
         state = await self.state_reader.get_state(entity_id)
         
         if state is None:
@@ -302,59 +578,91 @@ class ContractInputReader:
             "last_check": state.attributes.get("last_check"),
         }
 
-    async def get_device_metrics(self, device: str) -> dict[str, Any]:
+    async def get_device_metrics(
+        self, device: str
+    ) -> dict[str, SensorMetric | NumberMetric | SwitchMetric]:
         """Read Inputs D+E: sensor/number.{device}_{metric}_device
         
         Args:
             device: Device name
             
         Returns:
-            Dict of all runtime sensors and control entities for this device
+            Dict of all runtime sensors and control entities for this device,
+            keyed "{domain}_{metric}"
         """
-        metrics = {}
+        metrics: dict[str, SensorMetric | NumberMetric | SwitchMetric] = {}
         
-        # Get all entities for this device
-        # Pattern: sensor.{device}_*_device
-        sensor_pattern = f"sensor.{device}_"
-        number_pattern = f"number.{device}_"
-        switch_pattern = f"switch.{device}_"
+        entries = self._metric_index.get(device)
+        if entries is None:
+            entries = self._metric_index[device] = self._index_device_metrics(device)
         
-        # Search through all states
-        for entity_id, state in self.hass.states.async_all():
-            if not state:
+        # Current state of each indexed entity (O(entities of this device))
+        states_get = self.hass.states.get
+        for domain, key, entity_id in entries:
+            state = states_get(entity_id)
+            if state is None:
                 continue
+            attrs = state.attributes
             
-            # Check if entity matches device patterns
-            if entity_id.startswith(sensor_pattern) and entity_id.endswith("_device"):
-                # Extract metric name
-                metric = entity_id.replace(sensor_pattern, "").replace("_device", "")
-                metrics[f"sensor_{metric}"] = {
-                    "entity_id": entity_id,
-                    "state": state.state,
-                    "unit": state.attributes.get("unit_of_measurement"),
-                    "device_class": state.attributes.get("device_class"),
-                }
+            if domain == "sensor":
+                metrics[key] = SensorMetric(
+                    entity_id,
+                    state.state,
+                    attrs.get("unit_of_measurement"),
+                    attrs.get("device_class"),
+                )
             
-            elif entity_id.startswith(number_pattern) and entity_id.endswith("_device"):
-                metric = entity_id.replace(number_pattern, "").replace("_device", "")
-                metrics[f"number_{metric}"] = {
-                    "entity_id": entity_id,
-                    "state": state.state,
-                    "min": state.attributes.get("min"),
-                    "max": state.attributes.get("max"),
-                    "step": state.attributes.get("step"),
-                }
+            elif domain == "number":
+                metrics[key] = NumberMetric(
+                    entity_id,
+                    state.state,
+                    attrs.get("min"),
+                    attrs.get("max"),
+                    attrs.get("step"),
+                )
             
-            elif entity_id.startswith(switch_pattern) and entity_id.endswith("_device"):
-                metric = entity_id.replace(switch_pattern, "").replace("_device", "")
-                metrics[f"switch_{metric}"] = {
-                    "entity_id": entity_id,
-                    "state": state.state,
-                }
+            else:
+                metrics[key] = SwitchMetric(entity_id, state.state)
         
         _LOGGER.debug("Found %d metrics for device %s", len(metrics), device)
         return metrics
 
+    def _index_device_metrics(self, device: str) -> list[tuple[str, str, str]]:
+        """Collect the Inputs D+E entities of one device.
+        
+        Pattern: {sensor,number,switch}.{device}_{metric}_device
+        
+        Args:
+            device: Device name
+            
+        Returns:
+            List of (domain, "{domain}_{metric}" key, entity_id) tuples
+        """
+        if self._suffixed_ids is None:
+            # Domain index of the state machine (no scan over all states),
+            # reduced once to entities carrying the "_device" suffix
+            self._suffixed_ids = {
+                domain: [
+                    entity_id
+                    for entity_id in self.hass.states.async_entity_ids(domain)
+                    if entity_id.endswith("_device")
+                ]
+                for domain in METRIC_DOMAINS
+            }
+        
+        entries: list[tuple[str, str, str]] = []
+        suffix_len = len("_device")
+        for domain, entity_ids in self._suffixed_ids.items():
+            pattern = f"{domain}.{device}_"
+            prefix_len = len(pattern)
+            min_len = prefix_len + suffix_len
+            for entity_id in entity_ids:
+                if len(entity_id) > min_len and entity_id.startswith(pattern):
+                    # Extract metric name (prefix/suffix already confirmed)
+                    metric = entity_id[prefix_len:-suffix_len]
+                    entries.append((domain, f"{domain}_{metric}", entity_id))
+        return entries
+
     async def get_hardware_family(self, device: str) -> str | None:
         """Read Input F: sensor.{device}_hardware_family
         
@@ -364,7 +672,7 @@ class ContractInputReader:
         Returns:
             Hardware family string or None if not found
         """
-        entity_id = ENTITY_HARDWARE_FAMILY_PATTERN.format(device=device)
+        entity_id = _hardware_family_entity_id(device)
         
         family = await self.state_reader.get_state_value(entity_id, default=None)
         
@@ -383,6 +691,46 @@ class ContractInputReader:
         _LOGGER.debug("Hardware family for %s: %s", device, family)
         return family
 
+    async def read_all(self) -> dict[str, Any]:
+        """Read all Contract Inputs in one pass (coordinator snapshot).
+
+        Returns:
+            Dict with snapshot: {
+                'validation': dict,  # validate_inputs() result
+                'devices': list[str],  # Input A
+                'selected': str | None,  # Input B
+                'selected_kind': str | None,
+                'registry_devices': dict[str, list[RegistryDevice]],
+                'health': dict[str, dict],  # Input C per device
+            }
+        """
+        # Inputs A + B: one state lookup each, shared by every derived field
+        inputs = self._read_input_states()
+
+        devices = self._discovered_from_state(inputs["discovery"])
+        selected = self._selected_from_state(inputs["selector"])
+        validation = self._build_validation(
+            inputs["discovery"] is not None,
+            inputs["selector"] is not None,
+            devices,
+            selected,
+        )
+        registry_devices = await self.get_registry_devices()
+        selected_kind = self._device_kind(selected, devices)
+
+        health = {}
+        for device in devices:
+            health[device] = await self.get_device_health(device)
+
+        return {
+            "validation": validation,
+            "devices": devices,
+            "selected": selected,
+            "selected_kind": selected_kind,
+            "registry_devices": registry_devices,
+            "health": health,
+        }
+
     async def validate_inputs(self) -> dict[str, Any]:
         """Validate all required inputs are available.
         
@@ -393,24 +741,59 @@ class ContractInputReader:
                 'warnings': list[str],
             }
         """
+        # Inputs A + B read once each; existence, device list and selection
+        # are all derived from the same two State objects
+        inputs = self._read_input_states()
+        return self._build_validation(
+            inputs["discovery"] is not None,
+            inputs["selector"] is not None,
+            self._discovered_from_state(inputs["discovery"]),
+            self._selected_from_state(inputs["selector"]),
+        )
+
+    def _read_input_states(self) -> dict[str, State | None]:
+        """Look up the Input A + B states (one state machine read each).
+        
+        Returns:
+            Dict with 'discovery' and 'selector' State objects (None if missing)
+        """
+        states_get = self.hass.states.get
+        return {key: states_get(entity_id) for key, entity_id in self._input_keys}
+
+    @staticmethod
+    def _build_validation(
+        discovery_exists: bool,
+        selector_exists: bool,
+        devices: list[str],
+        selected: str | None,
+    ) -> dict[str, Any]:
+        """Build the validate_inputs() result from already-read inputs.
+        
+        Args:
+            discovery_exists: Whether Input A entity exists
+            selector_exists: Whether Input B entity exists
+            devices: Input A device list
+            selected: Input B selection (None if none)
+            
+        Returns:
+            Dict with validation results (see validate_inputs)
+        """
         missing = []
         warnings = []
         
         # Check Input A (Discovery) - CRITICAL
-        if not await self.state_reader.entity_exists(ENTITY_DISCOVERY_SENSOR):
+        if not discovery_exists:
             missing.append(f"Input A: {ENTITY_DISCOVERY_SENSOR}")
         
         # Check Input B (Selector) - CRITICAL
-        if not await self.state_reader.entity_exists(ENTITY_DEVICE_SELECTOR):
+        if not selector_exists:
             missing.append(f"Input B: {ENTITY_DEVICE_SELECTOR}")
         
         # Check discovered devices
-        devices = await self.get_discovered_devices()
         if not devices:
             warnings.append("No devices discovered (Input A returns empty list)")
         
         # Check selected device
-        selected = await self.get_selected_device()
         if selected is None:
             warnings.append("No device selected (Input B is 'none')")
         
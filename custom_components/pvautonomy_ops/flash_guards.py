@@ -3,19 +3,78 @@
 Enforces preflight requirements before flash/migrate/cleanup operations.
 """
 import logging
-from datetime import timedelta
-from typing import Any
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import Entity
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .config_flow import (
+    CONF_GATES_FRESHNESS_MIN,
+    CONF_STRICT_GATES,
+    DEFAULT_GATES_FRESHNESS_MIN,
+    DEFAULT_STRICT_GATES,
+)
+from .const import (
+    BLOCK_GATES_FAILED,
+    BLOCK_GATES_MISSING,
+    BLOCK_GATES_STALE,
+    BLOCK_GATES_WARNED,
+    BLOCK_INVALID_TIMESTAMP,
+    BLOCK_OP_BUSY,
+    DOMAIN,
+    ENTITY_STATUS_SENSOR,
+)
+from .gates import GatesSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
-# Guard configuration (default — overridden by Options Flow at runtime)
-DEFAULT_GATES_FRESHNESS_MINUTES = 10
+
+class FlashGuardConfig(NamedTuple):
+    """Guard settings resolved once from runtime config (Options Flow)."""
+
+    freshness_timeout: timedelta
+    strict_gates: bool
+
+
+def resolve_guard_config(runtime_config: Mapping[str, Any]) -> FlashGuardConfig:
+    """Resolve the flash guard settings from a runtime config snapshot.
+    
+    Args:
+        runtime_config: Runtime config mapping (options merged with defaults)
+        
+    Returns:
+        FlashGuardConfig for hass.data[DOMAIN]["guard_config"]
+    """
+    return FlashGuardConfig(
+        freshness_timeout=timedelta(
+            minutes=runtime_config.get(
+                CONF_GATES_FRESHNESS_MIN, DEFAULT_GATES_FRESHNESS_MIN
+            )
+        ),
+        strict_gates=runtime_config.get(CONF_STRICT_GATES, DEFAULT_STRICT_GATES),
+    )
+
+
+# Used when setup has not stored the configured guard settings
+_DEFAULT_GUARD_CONFIG: Final = resolve_guard_config(MappingProxyType({}))
+_NO_DOMAIN_DATA: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Fixed guard results (passed, block_reason, message)
+_GUARDS_PASSED: Final = (True, "", "Flash guards passed")
+_GATES_NOT_RUN: Final = (
+    False, BLOCK_GATES_MISSING, "Quality gates not run - press 'Run Gates' first"
+)
+_GATES_TIMESTAMP_MISSING: Final = (
+    False, BLOCK_GATES_MISSING, "Gates timestamp missing - press 'Run Gates' first"
+)
+_GATES_TIMESTAMP_INVALID: Final = (
+    False, BLOCK_INVALID_TIMESTAMP, "Gates timestamp invalid format - run gates again"
+)
 
 
 class FlashGuardError(Exception):
@@ -32,15 +91,134 @@ class FlashGuardError(Exception):
         super().__init__(message)
 
 
-async def check_flash_guards(hass: HomeAssistant) -> tuple[bool, str, str]:
+def _parse_iso_utc(value: str) -> datetime | None:
+    """Parse an ISO 8601 gates timestamp as an aware UTC datetime.
+    
+    Naive values are read in HA's configured time zone, as
+    dt_util.parse_datetime + dt_util.as_utc do.
+    
+    Args:
+        value: ISO 8601 timestamp
+        
+    Returns:
+        UTC datetime, or None if the value cannot be parsed
+    """
+    return _parse_iso_in_zone(value, dt_util.get_default_time_zone())
+
+
+@lru_cache(maxsize=16)
+def _parse_iso_in_zone(value: str, naive_tz: tzinfo) -> datetime | None:
+    """Cached _parse_iso_utc (keyed on the zone so a zone change re-parses).
+    
+    The status sensor republishes the same gates_last_run string until
+    gates are re-run, so repeated guard checks hit the cache.
+    
+    Args:
+        value: ISO 8601 timestamp
+        naive_tz: Time zone assumed for naive values
+        
+    Returns:
+        UTC datetime, or None if the value cannot be parsed
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=naive_tz)
+    return parsed.astimezone(timezone.utc)
+
+
+def collect_gate_attrs(hass: HomeAssistant) -> Mapping[str, Any] | None:
+    """Snapshot the status sensor attributes the guards evaluate.
+    
+    Args:
+        hass: Home Assistant instance
+        
+    Returns:
+        Status sensor attributes, or None if the sensor does not exist
+    """
+    status_state = hass.states.get(ENTITY_STATUS_SENSOR)
+    return status_state.attributes if status_state is not None else None
+
+
+@lru_cache(maxsize=8)
+def _evaluate_verdict(
+    gates_overall: str,
+    gates_fail: tuple[str, ...],
+    gates_warn: tuple[str, ...],
+    strict_gates: bool,
+) -> tuple[bool, str, str] | None:
+    """G-3: Gates must be PASS (not warn, not fail).
+    
+    Pure function of the gate run verdict, so repeated checks against the
+    same run are a cache hit.
+    
+    Args:
+        gates_overall: Overall gates status
+        gates_fail: Failed gate ids
+        gates_warn: Warned gate ids
+        strict_gates: Whether warnings block (strict_gates_required)
+        
+    Returns:
+        Block result (passed, block_reason, message), or None if the
+        verdict allows a flash
+    """
+    if gates_overall == "fail":
+        return False, BLOCK_GATES_FAILED, f"Gates FAILED: {', '.join(gates_fail)} - fix issues first"
+    
+    if gates_overall == "warn" and strict_gates:
+        return False, BLOCK_GATES_WARNED, f"Gates WARNED: {', '.join(gates_warn)} - resolve warnings (strict mode)"
+    
+    if gates_overall != "pass":
+        return False, BLOCK_GATES_FAILED, f"Gates status '{gates_overall}' not acceptable"
+    
+    return None
+
+
+def _evaluate_freshness(
+    last_run_ts: float,
+    fresh_until_ts: float,
+    now_ts: float,
+) -> tuple[bool, str, str] | None:
+    """G-2: Gates must be fresh (≤ gates_freshness_minutes).
+    
+    Args:
+        last_run_ts: Gate run time (epoch seconds)
+        fresh_until_ts: Freshness deadline (epoch seconds)
+        now_ts: Current time (epoch seconds)
+        
+    Returns:
+        Block result (passed, block_reason, message), or None if fresh
+    """
+    if now_ts <= fresh_until_ts:
+        return None
+    
+    age_min = int((now_ts - last_run_ts) / 60)
+    limit_min = int((fresh_until_ts - last_run_ts) / 60)
+    return False, BLOCK_GATES_STALE, f"Gates expired ({age_min}min old, limit {limit_min}min) - run gates again"
+
+
+@callback
+def check_flash_guards(
+    hass: HomeAssistant,
+    attrs: Mapping[str, Any] | None = None,
+) -> tuple[bool, str, str]:
     """Check all flash guard requirements (D-ADDON-FLASH-GUARD-001).
     
-    Reads gates_freshness_minutes and strict_gates_required from runtime
-    config (Options Flow).  Falls back to hardcoded defaults when config
-    is unavailable.
+    Reads the FlashGuardConfig resolved at setup from runtime config
+    (Options Flow).  Falls back to hardcoded defaults when config is
+    unavailable.
+    
+    The gates verdict comes from the GatesSnapshot published by the last
+    Run Gates press; the status sensor attributes are only evaluated when
+    no snapshot exists yet.  The checks themselves live in the
+    HA-independent _evaluate_verdict / _evaluate_freshness helpers.
     
     Args:
         hass: Home Assistant instance
+        attrs: collect_gate_attrs() snapshot to evaluate without a
+            GatesSnapshot (looked up here if not given)
         
     Returns:
         tuple[bool, str, str]: (passed, block_reason, message)
@@ -52,165 +230,246 @@ async def check_flash_guards(hass: HomeAssistant) -> tuple[bool, str, str]:
         FlashGuardError: If critical guards fail
     """
     # Read runtime config from Options Flow (P3-6-001)
-    runtime_config = hass.data.get(DOMAIN, {}).get("config", {})
-    freshness_minutes = runtime_config.get(
-        "gates_freshness_minutes", DEFAULT_GATES_FRESHNESS_MINUTES
+    domain_data = hass.data.get(DOMAIN) or _NO_DOMAIN_DATA
+    guard_config: FlashGuardConfig = domain_data.get(
+        "guard_config", _DEFAULT_GUARD_CONFIG
     )
-    strict_gates = runtime_config.get("strict_gates_required", True)
-    gates_freshness_timeout = timedelta(minutes=freshness_minutes)
+    strict_gates = guard_config.strict_gates
 
-    # Get status sensor
-    status_entity_id = "sensor.pvautonomy_ops_status"
-    status_state = hass.states.get(status_entity_id)
+    snapshot: GatesSnapshot | None = domain_data.get("gates")
+    if snapshot is not None:
+        # Typed verdict of the last gate run (freshness deadline included)
+        gates_overall = snapshot.overall
+        gates_fail = snapshot.fail
+        gates_warn = snapshot.warn
+        gates_last_run = None
+        last_run_ts = snapshot.last_run_ts
+        fresh_until_ts = snapshot.fresh_until_ts
+    else:
+        # Get status sensor attributes
+        if attrs is None:
+            attrs = collect_gate_attrs(hass)
+        
+        if attrs is None:
+            raise FlashGuardError(
+                BLOCK_GATES_MISSING,
+                "Status sensor not found - cannot validate gates"
+            )
+        
+        # G-1: Gates must exist (the sensor publishes these keys as null
+        # until gates run, so a missing value is None rather than KeyError)
+        get_attr = attrs.get
+        gates_overall = get_attr("gates_overall")
+        gates_last_run = get_attr("gates_last_run")
+        
+        if gates_overall is None or gates_last_run is None:
+            if gates_overall is None:
+                _LOGGER.warning("Flash blocked: gates_overall is null (run gates first)")
+                return _GATES_NOT_RUN
+            _LOGGER.warning("Flash blocked: gates_last_run is null")
+            return _GATES_TIMESTAMP_MISSING
+        
+        gates_fail = tuple(get_attr("gates_fail") or ())
+        gates_warn = tuple(get_attr("gates_warn") or ())
+        last_run_ts = None  # parsed only once the verdict allows a flash
     
-    if not status_state:
-        raise FlashGuardError(
-            "gates_missing",
-            "Status sensor not found - cannot validate gates"
+    # G-3 before G-2 so a failed run never pays for the freshness parse
+    if gates_overall == "warn" and not strict_gates and _LOGGER.isEnabledFor(logging.WARNING):
+        _LOGGER.warning(
+            "Flash allowed despite warnings (strict_gates=False): %s",
+            ", ".join(gates_warn)
         )
     
-    attrs = status_state.attributes
+    blocked = _evaluate_verdict(gates_overall, gates_fail, gates_warn, strict_gates)
+    if blocked is not None:
+        _LOGGER.warning("Flash blocked: gates_overall=%s (%s)", gates_overall, blocked[2])
+        return blocked
     
-    # G-1: Gates must exist
-    gates_overall = attrs.get("gates_overall")
-    gates_last_run = attrs.get("gates_last_run")
-    
-    if gates_overall is None:
-        _LOGGER.warning("Flash blocked: gates_overall is null (run gates first)")
-        return False, "gates_missing", "Quality gates not run - press 'Run Gates' first"
-    
-    if gates_last_run is None:
-        _LOGGER.warning("Flash blocked: gates_last_run is null")
-        return False, "gates_missing", "Gates timestamp missing - press 'Run Gates' first"
-    
-    # G-2: Gates must be fresh (≤ 10 minutes)
-    # Use HA datetime utilities for TZ-safe comparison
-    try:
-        parsed = dt_util.parse_datetime(gates_last_run)
-        if not parsed:
+    if last_run_ts is None:
+        last_run_utc = (
+            _parse_iso_utc(gates_last_run) if isinstance(gates_last_run, str) else None
+        )
+        if last_run_utc is None:
             _LOGGER.error(
                 "Flash blocked: cannot parse gates_last_run timestamp: %s",
                 gates_last_run
             )
-            return False, "invalid_timestamp", "Gates timestamp invalid format - run gates again"
-        
-        # Convert to UTC for comparison
-        last_run_utc = dt_util.as_utc(parsed)
-        now = dt_util.utcnow()
-        age = now - last_run_utc
-        
-        if age > gates_freshness_timeout:
-            _LOGGER.warning(
-                "Flash blocked: gates too old (age=%s, limit=%s)",
-                age,
-                gates_freshness_timeout
-            )
-            return False, "gates_stale", f"Gates expired ({int(age.total_seconds() / 60)}min old, limit {freshness_minutes}min) - run gates again"
+            return _GATES_TIMESTAMP_INVALID
+        last_run_ts = last_run_utc.timestamp()
+        fresh_until_ts = last_run_ts + guard_config.freshness_timeout.total_seconds()
     
-    except Exception as e:
-        _LOGGER.error("Flash blocked: error processing gates_last_run: %s", e, exc_info=True)
-        return False, "invalid_timestamp", "Gates timestamp processing failed - run gates again"
-    
-    # G-3: Gates must be PASS (not warn, not fail)
-    if gates_overall == "fail":
-        gates_fail = attrs.get("gates_fail", [])
-        _LOGGER.warning(
-            "Flash blocked: gates_overall=fail (failed gates: %s)",
-            ", ".join(gates_fail)
-        )
-        return False, "gates_failed", f"Gates FAILED: {', '.join(gates_fail)} - fix issues first"
-    
-    if gates_overall == "warn":
-        gates_warn = attrs.get("gates_warn", [])
-        if strict_gates:
-            _LOGGER.warning(
-                "Flash blocked: gates_overall=warn, strict_gates=True (warned gates: %s)",
-                ", ".join(gates_warn)
-            )
-            return False, "gates_warned", f"Gates WARNED: {', '.join(gates_warn)} - resolve warnings (strict mode)"
-        else:
-            _LOGGER.warning(
-                "Flash allowed despite warnings (strict_gates=False): %s",
-                ", ".join(gates_warn)
-            )
-    
-    if gates_overall != "pass":
-        _LOGGER.warning("Flash blocked: gates_overall=%s (expected 'pass')", gates_overall)
-        return False, "gates_failed", f"Gates status '{gates_overall}' not acceptable"
+    now_ts = time.time()
+    blocked = _evaluate_freshness(last_run_ts, fresh_until_ts, now_ts)
+    if blocked is not None:
+        _LOGGER.warning("Flash blocked: gates too old (%s)", blocked[2])
+        return blocked
     
     # All guards passed
     _LOGGER.info(
-        "Flash guards PASSED: gates=%s, age=%s",
+        "Flash guards PASSED: gates=%s, age=%.1fs",
         gates_overall,
-        age
+        now_ts - last_run_ts
+    )
+    return _GUARDS_PASSED
+
+
+def _format_gates_missing(attrs: Mapping[str, Any]) -> str:
+    """Block message for gates that were never run."""
+    return (
+        "⚠️ Quality gates not run yet.\n"
+        "Next step: Press 'Run Gates' button first."
+    )
+
+
+def _render_gates_stale(last_run_ts: float | None) -> str:
+    """Render the expired-gates block message, with the age when known."""
+    if last_run_ts is not None:
+        age_min = int((time.time() - last_run_ts) / 60)
+        return (
+            f"⚠️ Quality gates expired (last run: {age_min} minutes ago).\n"
+            f"Next step: Press 'Run Gates' to refresh validation."
+        )
+    return "⚠️ Quality gates too old. Next step: Run gates again."
+
+
+def _format_gates_stale(attrs: Mapping[str, Any]) -> str:
+    """Block message for expired gates, with their age when known."""
+    last_run = attrs.get("gates_last_run")
+    # Same cached parse check_flash_guards just did for this timestamp
+    last_run_utc = _parse_iso_utc(last_run) if isinstance(last_run, str) else None
+    return _render_gates_stale(
+        last_run_utc.timestamp() if last_run_utc is not None else None
     )
-    return True, "", "Flash guards passed"
 
 
-async def format_guard_block_message(
+# The list/name based messages are rendered once per distinct input: a
+# blocked button is often pressed again before gates are re-run.  The
+# stale message embeds the current age and is always rendered fresh.
+@lru_cache(maxsize=32)
+def _render_gates_failed(gates_fail: tuple[str, ...]) -> str:
+    """Render the failed-gates block message."""
+    if gates_fail:
+        return (
+            f"⚠️ Quality gates FAILED: {', '.join(gates_fail)}\n"
+            f"Next step: Fix issues, then run gates again."
+        )
+    return "⚠️ Quality gates failed. Next step: Check gate details and fix issues."
+
+
+@lru_cache(maxsize=32)
+def _render_gates_warned(gates_warn: tuple[str, ...]) -> str:
+    """Render the warned-gates block message."""
+    if gates_warn:
+        return (
+            f"⚠️ Quality gates WARNED: {', '.join(gates_warn)}\n"
+            f"Next step: Resolve warnings or acknowledge risk."
+        )
+    return "⚠️ Quality gates have warnings. Next step: Review and resolve."
+
+
+@lru_cache(maxsize=32)
+def _render_op_busy(op_name: str) -> str:
+    """Render the operation-busy block message."""
+    return (
+        f"⚠️ Operation already running: {op_name}\n"
+        f"Next step: Wait for operation to complete."
+    )
+
+
+def _format_gates_failed(attrs: Mapping[str, Any]) -> str:
+    """Block message listing the failed gates."""
+    return _render_gates_failed(tuple(attrs.get("gates_fail") or ()))
+
+
+def _format_gates_warned(attrs: Mapping[str, Any]) -> str:
+    """Block message listing the warned gates."""
+    return _render_gates_warned(tuple(attrs.get("gates_warn") or ()))
+
+
+def _format_op_busy(attrs: Mapping[str, Any]) -> str:
+    """Block message naming the operation already running."""
+    return _render_op_busy(str(attrs.get("op_name", "unknown")))
+
+
+# Block reason -> message formatter (status sensor attrs -> message)
+_BLOCK_MESSAGE_FORMATTERS: Final[Mapping[str, Callable[[Mapping[str, Any]], str]]] = (
+    MappingProxyType(
+        {
+            BLOCK_GATES_MISSING: _format_gates_missing,
+            BLOCK_GATES_STALE: _format_gates_stale,
+            BLOCK_GATES_FAILED: _format_gates_failed,
+            BLOCK_GATES_WARNED: _format_gates_warned,
+            BLOCK_OP_BUSY: _format_op_busy,
+        }
+    )
+)
+
+
+def _format_snapshot_stale(snapshot: GatesSnapshot) -> str:
+    """Block message for an expired GatesSnapshot."""
+    return _render_gates_stale(snapshot.last_run_ts)
+
+
+def _format_snapshot_failed(snapshot: GatesSnapshot) -> str:
+    """Block message listing the GatesSnapshot's failed gates."""
+    return _render_gates_failed(snapshot.fail)
+
+
+def _format_snapshot_warned(snapshot: GatesSnapshot) -> str:
+    """Block message listing the GatesSnapshot's warned gates."""
+    return _render_gates_warned(snapshot.warn)
+
+
+# Block reason -> message formatter for verdicts taken from a GatesSnapshot
+_SNAPSHOT_MESSAGE_FORMATTERS: Final[Mapping[str, Callable[[GatesSnapshot], str]]] = (
+    MappingProxyType(
+        {
+            BLOCK_GATES_STALE: _format_snapshot_stale,
+            BLOCK_GATES_FAILED: _format_snapshot_failed,
+            BLOCK_GATES_WARNED: _format_snapshot_warned,
+        }
+    )
+)
+
+
+@callback
+def format_guard_block_message(
     hass: HomeAssistant,
-    block_reason: str
+    block_reason: str,
+    attrs: Mapping[str, Any] | None = None,
+    snapshot: GatesSnapshot | None = None,
 ) -> str:
     """Format user-friendly block message with actionable guidance.
     
+    Gate verdicts are described from the same source check_flash_guards
+    took them from: the GatesSnapshot when one is published, otherwise
+    the status sensor attributes.
+    
     Args:
         hass: Home Assistant instance
         block_reason: Machine-readable block reason
+        attrs: collect_gate_attrs() snapshot, used when no GatesSnapshot
+            exists and for non-gate reasons (looked up here if not given)
+        snapshot: GatesSnapshot the guards were checked against (read
+            from hass.data if not given)
         
     Returns:
         str: Formatted block message with next steps
     """
-    status_entity_id = "sensor.pvautonomy_ops_status"
-    status_state = hass.states.get(status_entity_id)
-    
-    if not status_state:
-        return "Status sensor unavailable - cannot determine block reason"
-    
-    attrs = status_state.attributes
+    if snapshot is None:
+        snapshot = (hass.data.get(DOMAIN) or _NO_DOMAIN_DATA).get("gates")
+    if snapshot is not None:
+        snapshot_formatter = _SNAPSHOT_MESSAGE_FORMATTERS.get(block_reason)
+        if snapshot_formatter is not None:
+            return snapshot_formatter(snapshot)
     
-    if block_reason == "gates_missing":
-        return (
-            "⚠️ Quality gates not run yet.\n"
-            "Next step: Press 'Run Gates' button first."
-        )
-    
-    if block_reason == "gates_stale":
-        last_run = attrs.get("gates_last_run")
-        if last_run:
-            try:
-                last_run_dt = datetime.fromisoformat(last_run)
-                age_min = int((datetime.now(timezone.utc) - last_run_dt).total_seconds() / 60)
-                return (
-                    f"⚠️ Quality gates expired (last run: {age_min} minutes ago).\n"
-                    f"Next step: Press 'Run Gates' to refresh validation."
-                )
-            except (ValueError, TypeError):
-                pass
-        return "⚠️ Quality gates too old. Next step: Run gates again."
-    
-    if block_reason == "gates_failed":
-        gates_fail = attrs.get("gates_fail", [])
-        if gates_fail:
-            return (
-                f"⚠️ Quality gates FAILED: {', '.join(gates_fail)}\n"
-                f"Next step: Fix issues, then run gates again."
-            )
-        return "⚠️ Quality gates failed. Next step: Check gate details and fix issues."
-    
-    if block_reason == "gates_warned":
-        gates_warn = attrs.get("gates_warn", [])
-        if gates_warn:
-            return (
-                f"⚠️ Quality gates WARNED: {', '.join(gates_warn)}\n"
-                f"Next step: Resolve warnings or acknowledge risk."
-            )
-        return "⚠️ Quality gates have warnings. Next step: Review and resolve."
+    if attrs is None:
+        attrs = collect_gate_attrs(hass)
     
-    if block_reason == "op_busy":
-        op_name = attrs.get("op_name", "unknown")
-        return (
-            f"⚠️ Operation already running: {op_name}\n"
-            f"Next step: Wait for operation to complete."
-        )
+    if attrs is None:
+        return "Status sensor unavailable - cannot determine block reason"
     
-    return f"⚠️ Flash blocked: {block_reason}"
+    formatter = _BLOCK_MESSAGE_FORMATTERS.get(block_reason)
+    if formatter is None:
+        return f"⚠️ Flash blocked: {block_reason}"
+    return formatter(attrs)
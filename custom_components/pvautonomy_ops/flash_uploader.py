@@ -20,7 +20,7 @@ import hashlib
 import logging
 import secrets as secrets_module
 import socket as socket_module
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from pathlib import Path
 
 import yaml
@@ -150,7 +150,7 @@ async def ota_upload(
     port: int = OTA_DEFAULT_PORT,
     password: str | None = None,
     firmware_path: Path,
-    progress_cb: Callable[[int], Awaitable[None]] | None = None,
+    progress_cb: Callable[[int], None] | None = None,
     timeout_s: float = 120.0,
 ) -> None:
     """Upload firmware to device via espota2 protocol (SHA256 auth, OTA v2.0).
@@ -161,7 +161,8 @@ async def ota_upload(
         port: OTA port (default 3232)
         password: OTA password (None = no auth expected)
         firmware_path: Path to firmware.bin file
-        progress_cb: Async callback receiving progress percentage (0-100)
+        progress_cb: Callback receiving progress percentage (0-100); called
+            synchronously on the event loop, must not block
         timeout_s: Overall timeout in seconds
 
     Raises:
@@ -312,7 +313,7 @@ async def ota_upload(
             pct = int((offset / upload_size) * 100)
             if progress_cb and pct >= last_reported_pct + 5:
                 last_reported_pct = pct
-                await progress_cb(pct)
+                progress_cb(pct)
 
         # ── FINALIZE ─────────────────────────────────────────────
         if sock:
@@ -344,7 +345,11 @@ async def ota_upload(
 # ── Device resolution helpers ────────────────────────────────────────
 
 
-def resolve_device_ip(hass: HomeAssistant, device_id: str) -> str | None:
+def resolve_device_ip(
+    hass: HomeAssistant,
+    device_id: str,
+    entity_cache: dict[str, str] | None = None,
+) -> str | None:
     """Resolve device IP from HA entity states.
 
     Search strategy (ordered by priority):
@@ -356,10 +361,43 @@ def resolve_device_ip(hass: HomeAssistant, device_id: str) -> str | None:
     Args:
         hass: Home Assistant instance
         device_id: Device identifier (e.g., "sph10k_haus_03")
+        entity_cache: Optional device_id → IP entity_id cache. A cached
+            entity is read directly (O(1)); the search only runs on a miss
+            or when the cached entity has no usable IP. The entity, not the
+            IP, is cached so DHCP changes are always picked up.
 
     Returns:
         IP address string, or None if not resolvable
     """
+    if entity_cache is not None and device_id in entity_cache:
+        state = hass.states.get(entity_cache[device_id])
+        if state and state.state not in ("unknown", "unavailable", ""):
+            _LOGGER.debug(
+                "Device IP resolved via cached %s → %s", state.entity_id, state.state
+            )
+            return state.state
+        del entity_cache[device_id]
+
+    entity_id = _find_device_ip_entity(hass, device_id)
+    if entity_id is None:
+        _LOGGER.warning("Could not resolve IP for device '%s'", device_id)
+        return None
+
+    if entity_cache is not None:
+        entity_cache[device_id] = entity_id
+    return hass.states.get(entity_id).state
+
+
+def _find_device_ip_entity(hass: HomeAssistant, device_id: str) -> str | None:
+    """Find the entity currently holding a usable IP for a device.
+
+    Args:
+        hass: Home Assistant instance
+        device_id: Device identifier
+
+    Returns:
+        entity_id, or None if no entity has a usable IP
+    """
     # Priority patterns (most specific first)
     patterns = [
         f"text_sensor.{device_id}_ip_adresse",
@@ -372,7 +410,7 @@ def resolve_device_ip(hass: HomeAssistant, device_id: str) -> str | None:
         state = hass.states.get(entity_id)
         if state and state.state not in ("unknown", "unavailable", ""):
             _LOGGER.info("Device IP resolved via %s → %s", entity_id, state.state)
-            return state.state
+            return entity_id
 
     # Fuzzy fallback: scan text_sensors for device_id + "ip"
     for entity_id in hass.states.async_entity_ids("text_sensor"):
@@ -380,9 +418,8 @@ def resolve_device_ip(hass: HomeAssistant, device_id: str) -> str | None:
             state = hass.states.get(entity_id)
             if state and state.state not in ("unknown", "unavailable", ""):
                 _LOGGER.info("Device IP resolved via %s → %s (fuzzy)", entity_id, state.state)
-                return state.state
+                return entity_id
 
-    _LOGGER.warning("Could not resolve IP for device '%s'", device_id)
     return None
 
 
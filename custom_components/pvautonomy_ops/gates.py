@@ -2,13 +2,15 @@
 
 Validates production readiness via automated checks.
 """
+import json
 import logging
+import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, TypedDict
+from typing import TypedDict
 
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
 from .discovery import ContractInputReader
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,6 +41,23 @@ class GatesSummary(TypedDict):
     checked_at: str  # ISO 8601
 
 
+@dataclass(slots=True, frozen=True)
+class GatesSnapshot:
+    """Latest gate run verdict, as consumed by the flash guards.
+
+    Published to hass.data[DOMAIN]["gates"] alongside the status sensor
+    gates_* attributes so guard checks need no attribute or ISO parsing.
+    The freshness deadline uses the budget in force when the gates ran;
+    changing that option reloads the entry, which drops the snapshot.
+    """
+
+    overall: str  # 'pass' | 'warn' | 'fail'
+    last_run_ts: float  # epoch seconds
+    fresh_until_ts: float  # epoch seconds
+    fail: tuple[str, ...]
+    warn: tuple[str, ...]
+
+
 class QualityGateChecker:
     """Production readiness quality gate checker."""
 
@@ -344,9 +363,6 @@ class QualityGateChecker:
             List of grandfathered device names (e.g., ['sph10k_haus_03'])
         """
         try:
-            import json
-            import os
-
             allowlist_path = os.path.join(
                 os.path.dirname(__file__), "data", "legacy_allowlist.json"
             )
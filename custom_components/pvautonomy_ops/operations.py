@@ -15,8 +15,6 @@ from enum import Enum
 from typing import Any, Callable, Optional
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
-from datetime import timedelta
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +32,13 @@ class OperationLock:
     """Single-flight operation lock.
     
     Ensures only ONE operation runs at a time across all actions.
+    
+    Deliberately global rather than keyed per (operation, device): the
+    buttons act on the single device selected in Input B, OperationTracker
+    models exactly one running operation (op_state/op_name/op_progress),
+    and gates/flash/restart must not interleave on the same fleet. A
+    per-device lock would need a per-device tracker and status schema
+    first (contract change), so fleet OTA parallelism is out of scope here.
     """
     
     def __init__(self):
@@ -4,13 +4,12 @@ Publishes add-on status and device count to Home Assistant.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONTRACT_VERSION,
@@ -24,7 +23,7 @@ from .const import (
     STATE_WARN,
     VERSION,
 )
-from .discovery import ContractInputReader
+from .coordinator import PVAutonomyOpsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,50 +34,30 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up PVAutonomy Ops sensors from a ConfigEntry."""
-    _LOGGER.info("Setting up PVAutonomy Ops sensors (ConfigEntry)")
+    _LOGGER.debug("Setting up PVAutonomy Ops sensors (ConfigEntry)")
 
-    input_reader: ContractInputReader = hass.data[DOMAIN]["input_reader"]
+    coordinator: PVAutonomyOpsCoordinator = hass.data[DOMAIN]["coordinator"]
     operation_tracker = hass.data[DOMAIN]["operation_tracker"]
 
     async_add_entities(
         [
-            PVAutonomyOpsStatusSensor(input_reader, operation_tracker),
-            PVAutonomyOpsDevicesCountSensor(input_reader),
-        ],
-        True,
+            PVAutonomyOpsStatusSensor(coordinator, operation_tracker),
+            PVAutonomyOpsDevicesCountSensor(coordinator),
+        ]
     )
 
 
-async def async_setup_platform(
-    hass: HomeAssistant,
-    config: ConfigType,
-    async_add_entities: AddEntitiesCallback,
-    discovery_info: DiscoveryInfoType | None = None,
-) -> None:
-    """Set up PVAutonomy Ops sensors (legacy YAML, kept for backward compat)."""
-    _LOGGER.info("Setting up PVAutonomy Ops sensors (YAML platform)")
-
-    input_reader: ContractInputReader = hass.data[DOMAIN]["input_reader"]
-    operation_tracker = hass.data[DOMAIN]["operation_tracker"]
-
-    async_add_entities(
-        [
-            PVAutonomyOpsStatusSensor(input_reader, operation_tracker),
-            PVAutonomyOpsDevicesCountSensor(input_reader),
-        ],
-        True,
-    )
-
-
-class PVAutonomyOpsStatusSensor(SensorEntity):
+class PVAutonomyOpsStatusSensor(
+    CoordinatorEntity[PVAutonomyOpsCoordinator], SensorEntity
+):
     """Output G: sensor.pvautonomy_ops_status."""
 
     _attr_name = "PVAutonomy Ops Status"
     _attr_unique_id = ENTITY_STATUS_SENSOR
     _attr_suggested_object_id = ENTITY_STATUS_SENSOR
 
-    def __init__(self, input_reader: ContractInputReader, operation_tracker) -> None:
-        self.input_reader = input_reader
+    def __init__(self, coordinator: PVAutonomyOpsCoordinator, operation_tracker) -> None:
+        super().__init__(coordinator)
         self.operation_tracker = operation_tracker  # Phase 3: lifecycle tracking
         self._attr_native_value = STATE_INITIALIZING
         self._attr_extra_state_attributes = {
@@ -110,6 +89,9 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
         """Register event listeners when sensor is added to HA."""
         await super().async_added_to_hass()
         
+        # Render initial attributes from the coordinator snapshot
+        self._refresh_attributes()
+        
         # Listen for gate completion events
         self.hass.bus.async_listen(
             f"{DOMAIN}_gates_completed",
@@ -124,6 +106,17 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
         
         _LOGGER.debug("Registered gates_completed + flash_stage event listeners")
 
+    @property
+    def available(self) -> bool:
+        """Always available: input read failures are reported as state 'error'."""
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle fresh Contract Input snapshot from the coordinator."""
+        self._refresh_attributes()
+        self.async_write_ha_state()
+
     async def _handle_gates_completed(self, event) -> None:
         """Handle gate completion event and update attributes.
         
@@ -151,8 +144,9 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
             data.get("gates_failed", 0),
         )
         
-        # Trigger sensor update to refresh attributes
-        self.async_schedule_update_ha_state(True)
+        # Re-render attributes from the current snapshot (no input re-read)
+        self._refresh_attributes()
+        self.async_write_ha_state()
 
     async def _handle_flash_stage(self, event) -> None:
         """Handle flash stage event and update attributes.
@@ -197,26 +191,34 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
             data.get("target_device"),
         )
         
-        # Trigger sensor update to refresh attributes
-        self.async_schedule_update_ha_state(True)
+        # Re-render attributes from the current snapshot (no input re-read)
+        self._refresh_attributes()
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
+    def _refresh_attributes(self) -> None:
+        """Build state + attributes from the coordinator snapshot."""
         try:
-            validation = await self.input_reader.validate_inputs()
-            devices = await self.input_reader.get_discovered_devices()
-            selected = await self.input_reader.get_selected_device()
+            data = self.coordinator.data
+            if not self.coordinator.last_update_success or data is None:
+                raise RuntimeError(
+                    f"Contract input read failed: {self.coordinator.last_exception}"
+                )
+
+            validation = data["validation"]
+            devices = data["devices"]
+            selected = data["selected"]
 
             # P3-8-001: Device Registry scan for Factory + Production
-            registry_devices = await self.input_reader.get_registry_devices()
+            registry_devices = data["registry_devices"]
             factory_devices = registry_devices.get("factory", [])
             production_devices = registry_devices.get("production", [])
-            selected_kind = await self.input_reader.get_selected_device_kind()
+            selected_kind = data["selected_kind"]
 
             devices_online = 0
             devices_offline = 0
 
             for device in devices:
-                health = await self.input_reader.get_device_health(device)
+                health = data["health"][device]
                 if not health.get("available", False):
                     devices_offline += 1
                     continue
@@ -303,8 +305,8 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
                 "last_error_time": last_error_time or op_attrs.get("last_error_time"),
                 
                 # P3-8-001: Factory + Production device lists (D-OPS-FACTORY-DISCOVERY-001 R4)
-                "factory_devices": [d["name"] for d in factory_devices],
-                "production_devices": [d["name"] for d in production_devices],
+                "factory_devices": [d.name for d in factory_devices],
+                "production_devices": [d.name for d in production_devices],
                 "factory_count": len(factory_devices),
                 "production_count": len(production_devices),
                 
@@ -336,15 +338,17 @@ class PVAutonomyOpsStatusSensor(SensorEntity):
             }
 
 
-class PVAutonomyOpsDevicesCountSensor(SensorEntity):
+class PVAutonomyOpsDevicesCountSensor(
+    CoordinatorEntity[PVAutonomyOpsCoordinator], SensorEntity
+):
     """Output H: sensor.pvautonomy_ops_devices_count."""
 
     _attr_name = "PVAutonomy Ops Devices Count"
     _attr_unique_id = ENTITY_DEVICE_COUNT_SENSOR
     _attr_suggested_object_id = ENTITY_DEVICE_COUNT_SENSOR
 
-    def __init__(self, input_reader: ContractInputReader) -> None:
-        self.input_reader = input_reader
+    def __init__(self, coordinator: PVAutonomyOpsCoordinator) -> None:
+        super().__init__(coordinator)
         self._attr_native_value = 0
         self._attr_extra_state_attributes = {
             "online": 0,
@@ -354,17 +358,40 @@ class PVAutonomyOpsDevicesCountSensor(SensorEntity):
             "production": 0,
         }
 
-    async def async_update(self) -> None:
+    async def async_added_to_hass(self) -> None:
+        """Render initial attributes when sensor is added to HA."""
+        await super().async_added_to_hass()
+        self._refresh_attributes()
+
+    @property
+    def available(self) -> bool:
+        """Always available: input read failures are reported as count 0."""
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle fresh Contract Input snapshot from the coordinator."""
+        self._refresh_attributes()
+        self.async_write_ha_state()
+
+    def _refresh_attributes(self) -> None:
+        """Build state + attributes from the coordinator snapshot."""
         try:
-            devices = await self.input_reader.get_discovered_devices()
-            registry_devices = await self.input_reader.get_registry_devices()
+            data = self.coordinator.data
+            if not self.coordinator.last_update_success or data is None:
+                raise RuntimeError(
+                    f"Contract input read failed: {self.coordinator.last_exception}"
+                )
+
+            devices = data["devices"]
+            registry_devices = data["registry_devices"]
 
             online = 0
             offline = 0
             unknown = 0
 
             for device in devices:
-                health = await self.input_reader.get_device_health(device)
+                health = data["health"][device]
                 if not health.get("available", False):
                     unknown += 1
                 elif health.get("state", False):
@@ -80,10 +80,16 @@ class HomeAssistantStateReader:
         # Simple pattern matching using startswith
         if "*" in pattern:
             prefix = pattern.split("*")[0]
+            # Scan only the pattern's domain when the prefix names one
+            domain, dot, _ = prefix.partition(".")
+            states = (
+                self.hass.states.async_all(domain) if dot
+                else self.hass.states.async_all()
+            )
             return [
                 state
-                for entity_id, state in self.hass.states.async_all()
-                if entity_id.startswith(prefix)
+                for state in states
+                if state.entity_id.startswith(prefix)
             ]
         else:
             # Exact match